@@ -5,23 +5,48 @@ Ensures you authenticate with the correct Google account.
 
 import os
 import sys
-import pickle
 from urllib.parse import urlparse, parse_qs
 
+from token_store import (
+    google_libs_available, TOKEN_PATH, token_exists, load_credentials, save_credentials, remove_token,
+    load_account_info, save_account_info
+)
+
+# This script only talks to Google, so stop here with the install command if the libraries are missing
+if not google_libs_available():
+    sys.exit(1)
+
+from google_auth_oauthlib.flow import InstalledAppFlow
+from google.auth.transport.requests import Request
+from googleapiclient.discovery import build
+
+
+# Drive service objects built in this process, keyed by id(creds)
+_drive_services = {}
+
+
+def get_drive_service(creds):
+    """Build the Drive service once per credentials object, from the bundled discovery document."""
+    service = _drive_services.get(id(creds))
+    if service is None:
+        service = build('drive', 'v3', credentials=creds, static_discovery=True, cache_discovery=False)
+        _drive_services[id(creds)] = service
+    return service
+
+
+def get_account_info(creds) -> dict:
+    """Get the authenticated Drive user, using the local cache when possible."""
+    user = load_account_info(creds)
+    if user is None:
+        service = get_drive_service(creds)
+        about = service.about().get(fields='user').execute()
+        user = about.get('user', {})
+        save_account_info(creds, user)
+    return user
+
 
 def authenticate_with_account_choice():
     """Authenticate with Google Drive, with clear account selection."""
-    try:
-        from google.oauth2.credentials import Credentials
-        from google_auth_oauthlib.flow import InstalledAppFlow
-        from google.auth.transport.requests import Request
-    except ImportError:
-        print("Installing required packages...")
-        os.system("pip install -q google-auth-oauthlib google-auth-httplib2 google-api-python-client")
-        from google.oauth2.credentials import Credentials
-        from google_auth_oauthlib.flow import InstalledAppFlow
-        from google.auth.transport.requests import Request
-    
     SCOPES = [
         'https://www.googleapis.com/auth/drive.readonly',
         'https://www.googleapis.com/auth/drive.file'
@@ -39,13 +64,12 @@ def authenticate_with_account_choice():
         return False
     
     # Ask about existing token
-    if os.path.exists('token.pickle'):
+    if token_exists():
         print("Found existing authentication token.")
         print()
         
         try:
-            with open('token.pickle', 'rb') as token:
-                creds = pickle.load(token)
+            creds = load_credentials(SCOPES)
             
             # Try to get account info
             if creds and creds.valid:
@@ -54,10 +78,7 @@ def authenticate_with_account_choice():
                 
                 # Show which account if we can
                 try:
-                    from googleapiclient.discovery import build
-                    service = build('drive', 'v3', credentials=creds)
-                    about = service.about().get(fields='user').execute()
-                    user = about.get('user', {})
+                    user = get_account_info(creds)
                     email = user.get('emailAddress', 'Unknown')
                     print(f"📧 Authenticated as: {email}")
                 except:
@@ -71,23 +92,21 @@ def authenticate_with_account_choice():
                     return True
                 else:
                     print("\nRemoving old token to re-authenticate...")
-                    os.remove('token.pickle')
+                    remove_token()
             
             elif creds and creds.expired and creds.refresh_token:
                 print("Token expired. Refreshing...")
                 try:
                     creds.refresh(Request())
-                    with open('token.pickle', 'wb') as token:
-                        pickle.dump(creds, token)
+                    save_credentials(creds)
                     print("✅ Token refreshed!\n")
                     return True
                 except:
                     print("Could not refresh. Will re-authenticate...\n")
-                    os.remove('token.pickle')
+                    remove_token()
         except:
             print("Token invalid. Will re-authenticate...\n")
-            if os.path.exists('token.pickle'):
-                os.remove('token.pickle')
+            remove_token()
     
     # Start new authentication
     print("=" * 70)
@@ -211,8 +230,7 @@ def authenticate_with_account_choice():
                 creds = flow.credentials
                 
                 # Save credentials
-                with open('token.pickle', 'wb') as token:
-                    pickle.dump(creds, token)
+                save_credentials(creds)
                 
                 print()
                 print("=" * 70)
@@ -222,10 +240,7 @@ def authenticate_with_account_choice():
                 
                 # Try to show which account was authenticated
                 try:
-                    from googleapiclient.discovery import build
-                    service = build('drive', 'v3', credentials=creds)
-                    about = service.about().get(fields='user').execute()
-                    user = about.get('user', {})
+                    user = get_account_info(creds)
                     email = user.get('emailAddress', 'Unknown')
                     display_name = user.get('displayName', '')
                     
@@ -236,7 +251,7 @@ def authenticate_with_account_choice():
                     print("📧 Authentication complete!")
                 
                 print()
-                print("Token saved to: token.pickle")
+                print(f"Token saved to: {TOKEN_PATH}")
                 print()
                 print("✅ You can now:")
                 print("  • Download: python download_from_gdrive.py")
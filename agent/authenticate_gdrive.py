@@ -7,23 +7,18 @@ import os
 import sys
 from pathlib import Path
 
+from token_store import google_libs_available, TOKEN_PATH, token_exists, load_credentials, save_credentials, remove_token
+
+# This script only talks to Google, so stop here with the install command if the libraries are missing
+if not google_libs_available():
+    sys.exit(1)
+
+from google_auth_oauthlib.flow import InstalledAppFlow
+from google.auth.transport.requests import Request
+
 
 def authenticate_google_drive(credentials_path: str = "credentials.json"):
     """Authenticate with Google Drive API."""
-    try:
-        from google.oauth2.credentials import Credentials
-        from google_auth_oauthlib.flow import InstalledAppFlow
-        from google.auth.transport.requests import Request
-        import pickle
-    except ImportError:
-        print("❌ Google API libraries not installed.")
-        print("Installing...")
-        os.system("pip install google-auth-oauthlib google-auth-httplib2 google-api-python-client")
-        from google.oauth2.credentials import Credentials
-        from google_auth_oauthlib.flow import InstalledAppFlow
-        from google.auth.transport.requests import Request
-        import pickle
-    
     SCOPES = [
         'https://www.googleapis.com/auth/drive.readonly',
         'https://www.googleapis.com/auth/drive.file'
@@ -47,14 +42,12 @@ def authenticate_google_drive(credentials_path: str = "credentials.json"):
         print("See TROUBLESHOOTING_GDRIVE.md for detailed steps.")
         return False
     
-    token_path = 'token.pickle'
     creds = None
     
     # Check if we already have valid credentials
-    if os.path.exists(token_path):
-        print("Found existing token.pickle...")
-        with open(token_path, 'rb') as token:
-            creds = pickle.load(token)
+    if token_exists():
+        print("Found existing token...")
+        creds = load_credentials(SCOPES)
         
         # Check if credentials are valid and have the right scopes
         if creds and creds.valid:
@@ -69,14 +62,13 @@ def authenticate_google_drive(credentials_path: str = "credentials.json"):
             print("Refreshing expired token...")
             try:
                 creds.refresh(Request())
-                with open(token_path, 'wb') as token:
-                    pickle.dump(creds, token)
+                save_credentials(creds)
                 print("✅ Token refreshed successfully!")
                 return True
             except Exception as e:
                 print(f"⚠️  Could not refresh token: {e}")
                 print("Will re-authenticate...")
-                os.remove(token_path)
+                remove_token()
     
     # Need to authenticate
     print("Starting authentication process...")
@@ -148,15 +140,14 @@ def authenticate_google_drive(credentials_path: str = "credentials.json"):
             return False
         
         # Save credentials
-        with open(token_path, 'wb') as token:
-            pickle.dump(creds, token)
+        save_credentials(creds)
         
         print()
         print("=" * 70)
         print("✅ AUTHENTICATION SUCCESSFUL!")
         print("=" * 70)
         print()
-        print("Token saved to: token.pickle")
+        print(f"Token saved to: {TOKEN_PATH}")
         print()
         print("You can now:")
         print("  • Download: python download_from_gdrive.py")
@@ -188,9 +179,9 @@ def main():
     
     args = parser.parse_args()
     
-    if args.reset and os.path.exists('token.pickle'):
+    if args.reset and token_exists():
         print("Removing existing token...")
-        os.remove('token.pickle')
+        remove_token()
         print("✅ Token removed")
         print()
     
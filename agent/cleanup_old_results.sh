@@ -68,12 +68,23 @@ if [ -f "combined_history_*.csv" ]; then
     echo "  ✓ Moved combined history files"
 fi
 
+if ls combined_history_*.parquet >/dev/null 2>&1; then
+    mv combined_history_*.parquet "$ARCHIVE_DIR/" 2>/dev/null
+    echo "  ✓ Moved combined history Parquet files"
+fi
+
 # Archive old progress reports if they exist
 if [ -f "progress_report_*.txt" ]; then
     mv progress_report_*.txt "$ARCHIVE_DIR/" 2>/dev/null
     echo "  ✓ Moved progress reports"
 fi
 
+# Interrupted upload sessions point at the files being archived, so drop them
+if [ -f ".gdrive_resume.json" ]; then
+    rm -f .gdrive_resume.json
+    echo "  ✓ Removed interrupted upload checkpoints"
+fi
+
 echo ""
 echo "============================================"
 echo "✅ Cleanup Complete!"
@@ -3,11 +3,35 @@ Google Drive File Downloader
 Downloads Excel files from Google Drive before running QA analysis.
 """
 
+import importlib.util
 import os
+import re
 import sys
 from pathlib import Path
 from datetime import datetime
 
+from token_store import google_libs_available, load_credentials, save_credentials
+
+
+# Larger chunks mean fewer HTTPS round-trips per download (library default is 100 KB)
+DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Minimum change in percent before printing another progress line
+PROGRESS_STEP = 5
+
+# Maximum number of concurrent range requests for large downloads
+PARALLEL_DOWNLOADS = 8
+
+# Google Drive file ID locations, fused into a single pass over the URL
+FILE_ID_PATTERN = re.compile(
+    r'(?:/spreadsheets/d/'   # Spreadsheet URLs
+    r'|/document/d/'         # Document URLs
+    r'|/file/d/'             # File URLs
+    r'|/folders/'            # Folder URLs
+    r'|[?&]id=)'             # Query parameter (use [?&] to ensure it's a param)
+    r'([a-zA-Z0-9_-]+)'
+)
+
 
 def download_with_gdown(file_id: str, output_path: str) -> bool:
     """
@@ -20,12 +44,12 @@ def download_with_gdown(file_id: str, output_path: str) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    try:
-        import gdown
-    except ImportError:
-        print("❌ gdown not installed. Installing...")
-        os.system("pip install gdown")
-        import gdown
+    if importlib.util.find_spec('gdown') is None:
+        print("❌ gdown not installed.")
+        print("Install with: pip install gdown")
+        return False
+    
+    import gdown
     
     try:
         print(f"📥 Downloading from Google Drive (ID: {file_id})...")
@@ -50,25 +74,14 @@ def download_with_google_api(file_id: str, output_path: str, credentials_path: s
     Returns:
         True if successful, False otherwise
     """
-    try:
-        from google.oauth2.credentials import Credentials
-        from google_auth_oauthlib.flow import InstalledAppFlow
-        from google.auth.transport.requests import Request
-        from googleapiclient.discovery import build
-        from googleapiclient.http import MediaIoBaseDownload
-        import pickle
-        import io
-    except ImportError:
-        print("❌ Google API libraries not installed.")
-        print("Installing: google-auth-oauthlib google-auth-httplib2 google-api-python-client")
-        os.system("pip install google-auth-oauthlib google-auth-httplib2 google-api-python-client")
-        from google.oauth2.credentials import Credentials
-        from google_auth_oauthlib.flow import InstalledAppFlow
-        from google.auth.transport.requests import Request
-        from googleapiclient.discovery import build
-        from googleapiclient.http import MediaIoBaseDownload
-        import pickle
-        import io
+    # Only this download method needs the Google libraries; gdown works without them
+    if not google_libs_available():
+        return False
+    
+    from google_auth_oauthlib.flow import InstalledAppFlow
+    from google.auth.transport.requests import Request
+    from googleapiclient.discovery import build
+    from googleapiclient.http import MediaIoBaseDownload
     
     SCOPES = [
         'https://www.googleapis.com/auth/drive.readonly',
@@ -76,13 +89,8 @@ def download_with_google_api(file_id: str, output_path: str, credentials_path: s
     ]
     
     try:
-        creds = None
-        token_path = 'token.pickle'
-        
         # Load existing credentials
-        if os.path.exists(token_path):
-            with open(token_path, 'rb') as token:
-                creds = pickle.load(token)
+        creds = load_credentials(SCOPES)
         
         # If no valid credentials, authenticate
         if not creds or not creds.valid:
@@ -98,27 +106,35 @@ def download_with_google_api(file_id: str, output_path: str, credentials_path: s
                 creds = flow.run_local_server(port=0)
             
             # Save credentials for next time
-            with open(token_path, 'wb') as token:
-                pickle.dump(creds, token)
+            save_credentials(creds)
         
         # Download the file
         print(f"📥 Downloading from Google Drive (ID: {file_id})...")
-        service = build('drive', 'v3', credentials=creds)
-        request = service.files().get_media(fileId=file_id)
+        service = build('drive', 'v3', credentials=creds, static_discovery=True, cache_discovery=False)
         
-        fh = io.BytesIO()
-        downloader = MediaIoBaseDownload(fh, request)
+        # Large files are fetched as concurrent byte ranges; small ones in a single stream
+        size = int(service.files().get(fileId=file_id, fields='size').execute().get('size', 0))
+        if size > DOWNLOAD_CHUNK_SIZE:
+            download_ranges_in_parallel(creds, file_id, output_path, size)
+            print(f"✅ Downloaded successfully to: {output_path}")
+            return True
         
-        done = False
-        while not done:
-            status, done = downloader.next_chunk()
-            if status:
-                print(f"   Progress: {int(status.progress() * 100)}%")
+        request = service.files().get_media(fileId=file_id)
         
-        # Write to file
-        fh.seek(0)
-        with open(output_path, 'wb') as f:
-            f.write(fh.read())
+        # Stream chunks straight to disk instead of buffering the whole file in memory
+        with open(output_path, 'wb') as fh:
+            downloader = MediaIoBaseDownload(fh, request, chunksize=DOWNLOAD_CHUNK_SIZE)
+            
+            done = False
+            last_reported = -PROGRESS_STEP
+            while not done:
+                status, done = downloader.next_chunk()
+                if status:
+                    percent = int(status.progress() * 100)
+                    # Only report meaningful progress steps to keep stdout quiet
+                    if percent - last_reported >= PROGRESS_STEP or done:
+                        print(f"   Progress: {percent}%")
+                        last_reported = percent
         
         print(f"✅ Downloaded successfully to: {output_path}")
         return True
@@ -128,6 +144,72 @@ def download_with_google_api(file_id: str, output_path: str, credentials_path: s
         return False
 
 
+def download_ranges_in_parallel(creds, file_id: str, output_path: str, size: int) -> None:
+    """
+    Download a Drive file as concurrent HTTP range requests.
+    
+    Each range is written at its own offset in a pre-sized output file, so
+    the transfer is bounded by bandwidth rather than per-chunk latency. If any
+    range fails, the partial file is removed before the error is raised.
+    
+    Args:
+        creds: Authorized Google credentials
+        file_id: Google Drive file ID
+        output_path: Local path to save the file
+        size: File size in bytes (from the Drive metadata)
+    """
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from google.auth.transport.requests import AuthorizedSession
+    
+    url = f"https://www.googleapis.com/drive/v3/files/{file_id}?alt=media"
+    ranges = [(start, min(start + DOWNLOAD_CHUNK_SIZE, size) - 1)
+              for start in range(0, size, DOWNLOAD_CHUNK_SIZE)]
+    
+    # requests sessions are not thread-safe, so each worker thread gets its own
+    thread_local = threading.local()
+    sessions = []
+    
+    def get_session():
+        session = getattr(thread_local, 'session', None)
+        if session is None:
+            session = thread_local.session = AuthorizedSession(creds)
+            sessions.append(session)
+        return session
+    
+    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    completed = False
+    try:
+        os.ftruncate(fd, size)
+        
+        def fetch_range(byte_range):
+            start, end = byte_range
+            response = get_session().get(url, headers={'Range': f'bytes={start}-{end}'})
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise IOError(f"Server ignored range request (HTTP {response.status_code})")
+            os.pwrite(fd, response.content, start)
+            return end - start + 1
+        
+        downloaded = 0
+        last_reported = -PROGRESS_STEP
+        with ThreadPoolExecutor(max_workers=PARALLEL_DOWNLOADS) as executor:
+            for nbytes in executor.map(fetch_range, ranges):
+                downloaded += nbytes
+                percent = int(downloaded * 100 / size)
+                if percent - last_reported >= PROGRESS_STEP or downloaded == size:
+                    print(f"   Progress: {percent}%")
+                    last_reported = percent
+        completed = True
+    finally:
+        os.close(fd)
+        for session in sessions:
+            session.close()
+        if not completed:
+            # The pre-sized file would look complete while holding zero-filled gaps
+            os.unlink(output_path)
+
+
 def extract_file_id_from_url(url: str) -> str:
     """
     Extract file ID from various Google Drive URL formats.
@@ -137,25 +219,13 @@ def extract_file_id_from_url(url: str) -> str:
     - https://drive.google.com/open?id=FILE_ID
     - https://docs.google.com/spreadsheets/d/FILE_ID/edit
     """
-    import re
-    
-    # Order matters! Try most specific patterns first
-    patterns = [
-        r'/spreadsheets/d/([a-zA-Z0-9_-]+)',  # Spreadsheet URLs
-        r'/document/d/([a-zA-Z0-9_-]+)',      # Document URLs
-        r'/file/d/([a-zA-Z0-9_-]+)',          # File URLs
-        r'/folders/([a-zA-Z0-9_-]+)',         # Folder URLs
-        r'[?&]id=([a-zA-Z0-9_-]+)',           # Query parameter (use [?&] to ensure it's a param)
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            file_id = match.group(1)
-            # Make sure we didn't accidentally match a user ID (ouid)
-            # File IDs are typically 25-40 chars, user IDs are often longer numbers
-            if not file_id.isdigit() or len(file_id) < 20:
-                return file_id
+    # Path-based IDs always precede the query string, so the first acceptable match wins
+    for match in FILE_ID_PATTERN.finditer(url):
+        file_id = match.group(1)
+        # Make sure we didn't accidentally match a user ID (ouid)
+        # File IDs are typically 25-40 chars, user IDs are often longer numbers
+        if not file_id.isdigit() or len(file_id) < 20:
+            return file_id
     
     # If no pattern matched, assume it's already a file ID
     return url
@@ -24,11 +24,11 @@ fi
 
 echo ""
 echo "Step 1: Removing old token..."
-if [ -f "token.pickle" ]; then
-    rm token.pickle
-    echo "✅ Removed token.pickle"
+if [ -f "token.json" ] || [ -f "token.pickle" ]; then
+    rm -f token.json token.pickle token_meta.json
+    echo "✅ Removed saved token"
 else
-    echo "ℹ️  No token.pickle found (this is OK)"
+    echo "ℹ️  No saved token found (this is OK)"
 fi
 
 echo ""
@@ -3,86 +3,370 @@ HTML to PDF Converter
 Converts the HTML visualization report to PDF format.
 """
 
-import sys
+import asyncio
+import atexit
+import importlib.util
+import mmap
+import os
+import re
 from pathlib import Path
 
-def convert_html_to_pdf(html_path: str, pdf_path: str = None) -> str:
-    """Convert HTML file to PDF using available library."""
-    html_file = Path(html_path)
+
+# <link> tags pointing at bundled web CSS the PDF does not need
+_BUNDLE_LINK_RE = re.compile(rb'<link[^>]+href="[^"]*\.bundle[^"]*"[^>]*>')
+
+_pdf_converter = None
+
+# PDF backend chosen on first use: (name, engine), or () if none is installed
+_BACKEND = None
+
+# Headless Chrome shared by all pyppeteer conversions in this process
+_BROWSER = None
+
+# Event loop the shared browser is bound to, created on first use
+_LOOP = None
+
+
+class PdfConverter:
+    """
+    Converts HTML files to PDF with weasyprint, reusing parsed stylesheets,
+    fonts and images across conversions.
+    """
     
-    if not html_file.exists():
-        print(f"❌ HTML file not found: {html_path}")
-        return None
+    def __init__(self, stylesheets: list = None):
+        """
+        Initialize the converter.
+        
+        Args:
+            stylesheets: Optional paths of extra CSS files applied to every document
+        """
+        from weasyprint import HTML, CSS
+        from weasyprint.text.fonts import FontConfiguration
+        
+        self._html = HTML
+        self.font_config = FontConfiguration()
+        self.stylesheets = [CSS(filename=str(s), font_config=self.font_config)
+                            for s in (stylesheets or [])]
+        self.image_cache = {}
     
-    if pdf_path is None:
-        pdf_path = html_file.with_suffix('.pdf')
+    @staticmethod
+    def read_html(html_file: Path) -> bytes:
+        """Read an HTML file, dropping <link> tags to bundled web CSS."""
+        # Map the file instead of reading it; the regex scans the mapping directly,
+        # so the only copy made is the cleaned-up document
+        with open(html_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return b""
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _BUNDLE_LINK_RE.sub(b"", mm)
     
-    # Try weasyprint first (most reliable)
-    try:
-        from weasyprint import HTML
-        print(f"📄 Converting HTML to PDF using weasyprint...")
-        HTML(filename=str(html_file), encoding='utf-8').write_pdf(pdf_path)
+    def render(self, data: bytes, base_url: str, target=None):
+        """Render HTML bytes to a PDF file, or return the PDF bytes if no target is given."""
+        return self._html(string=data, base_url=base_url, encoding='utf-8').write_pdf(
+            target,
+            stylesheets=self.stylesheets,
+            font_config=self.font_config,
+            presentational_hints=False,
+            optimize_images=True,
+            cache=self.image_cache
+        )
+    
+    def convert(self, html_path, pdf_path) -> str:
+        """Convert a single HTML file to PDF."""
+        html_file = Path(html_path)
+        self.render(self.read_html(html_file), str(html_file.parent), pdf_path)
+        return str(pdf_path)
+    
+    def convert_split(self, html_path, pdf_path, split_selector: str, jobs: int = None) -> str:
+        """
+        Convert a large HTML file to PDF in independent chunks.
+        
+        The document is cut at every element matching split_selector, the
+        chunks are rendered in parallel processes and the PDFs are merged with
+        pypdf. Layout cost grows faster than document size, so several small
+        renders beat one big one.
+        
+        Args:
+            html_path: HTML file to convert
+            pdf_path: Output PDF path
+            split_selector: Simple 'tag.class' selector marking the split points
+            jobs: Number of worker processes (default: one per CPU)
+        """
+        import io
+        from concurrent.futures import ProcessPoolExecutor
+        from pypdf import PdfWriter
+        
+        html_file = Path(html_path)
+        parts = _split_html(self.read_html(html_file), split_selector)
+        if len(parts) == 1:
+            return self.convert(html_file, pdf_path)
+        
+        base_url = str(html_file.parent)
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            pdfs = list(executor.map(_render_chunk, parts, [base_url] * len(parts)))
+        
+        writer = PdfWriter()
+        for pdf in pdfs:
+            writer.append(io.BytesIO(pdf))
+        writer.write(str(pdf_path))
+        return str(pdf_path)
+
+
+def _split_html(data: bytes, split_selector: str) -> list:
+    """
+    Split an HTML document at each element matching a 'tag.class' selector.
+    
+    Every chunk keeps the document's <head> (and so its styles) and is
+    closed properly, so each one renders as a standalone page set.
+    """
+    tag, _, css_class = split_selector.partition('.')
+    class_pattern = rb'[^>]*class="[^"]*\b' + re.escape(css_class.encode()) + rb'\b[^"]*"' if css_class else b''
+    split_re = re.compile(rb'<' + re.escape(tag.encode()) + class_pattern + rb'[^>]*>', re.IGNORECASE)
+    
+    parts = split_re.split(data)
+    if len(parts) == 1:
+        return parts
+    
+    # Everything up to and including <body ...> opens each chunk after the first
+    body_open = re.search(rb'<body[^>]*>', parts[0], re.IGNORECASE)
+    prefix = parts[0][:body_open.end()] if body_open else b""
+    suffix = b"</body></html>"
+    
+    chunks = []
+    for i, part in enumerate(parts):
+        chunk = part if i == 0 else prefix + part
+        if i < len(parts) - 1:
+            chunk += suffix
+        chunks.append(chunk)
+    return chunks
+
+
+def _render_chunk(data: bytes, base_url: str) -> bytes:
+    """Render one HTML chunk to PDF bytes (runs in a worker process)."""
+    return _get_pdf_converter().render(data, base_url)
+
+
+def _get_pdf_converter() -> PdfConverter:
+    """Get the shared weasyprint converter, creating it on first use."""
+    global _pdf_converter
+    if _pdf_converter is None:
+        _pdf_converter = PdfConverter()
+    return _pdf_converter
+
+
+async def _get_browser():
+    """Get the shared headless browser, launching it on first use."""
+    global _BROWSER
+    if _BROWSER is None:
+        from pyppeteer import launch
+        _BROWSER = await launch(args=['--no-sandbox', '--disable-dev-shm-usage', '--disable-gpu'],
+                                handleSIGINT=False)
+    return _BROWSER
+
+
+async def close_browser_pool():
+    """Close the shared headless browser if one was launched."""
+    global _BROWSER
+    if _BROWSER is not None:
+        await _BROWSER.close()
+        _BROWSER = None
+
+
+def _run(coro):
+    """
+    Run a coroutine on this module's event loop.
+    
+    asyncio.run would close its loop after every call, but the shared browser
+    stays bound to the loop it was launched on, so one loop is kept for the process.
+    """
+    global _LOOP
+    if _LOOP is None:
+        _LOOP = asyncio.new_event_loop()
+    return _LOOP.run_until_complete(coro)
+
+
+def _close_browser_at_exit():
+    """Close the shared browser and its event loop when the interpreter exits."""
+    if _BROWSER is not None:
+        _run(close_browser_pool())
+    if _LOOP is not None:
+        _LOOP.close()
+
+
+async def convert_many(paths: list, concurrency: int = 4) -> list:
+    """
+    Convert many HTML files to PDF concurrently with the shared headless browser.
+    
+    Args:
+        paths: List of (html_path, pdf_path) tuples
+        concurrency: Maximum number of pages rendering at the same time
+    
+    Returns:
+        List of created PDF paths
+    """
+    browser = await _get_browser()
+    sem = asyncio.Semaphore(concurrency)
+    
+    async def _one(html_path, pdf_path):
+        async with sem:
+            page = await browser.newPage()
+            try:
+                await page.goto(f'file://{Path(html_path).absolute()}', {'waitUntil': 'networkidle0'})
+                await page.pdf({'path': str(pdf_path), 'format': 'A4', 'printBackground': True})
+            finally:
+                await page.close()
         print(f"✓ PDF created: {pdf_path}")
         return str(pdf_path)
-    except ImportError:
-        pass
     
-    # Try pdfkit (requires wkhtmltopdf installed)
+    return await asyncio.gather(*(_one(html, pdf) for html, pdf in paths))
+
+
+def _resolve_backend():
+    """
+    Pick the PDF backend once per process.
+    
+    Prefers pdfkit when the wkhtmltopdf binary is available (a native engine,
+    much faster on large tables), then weasyprint, then headless Chrome.
+    
+    Returns:
+        (name, engine) tuple, or None if no backend is installed
+    """
+    global _BACKEND
+    if _BACKEND is not None:
+        return _BACKEND or None
+    
+    _BACKEND = ()
     try:
         import pdfkit
-        print(f"📄 Converting HTML to PDF using pdfkit...")
-        options = {'encoding': 'UTF-8'}
-        pdfkit.from_file(str(html_file), str(pdf_path), options=options)
-        print(f"✓ PDF created: {pdf_path}")
-        return str(pdf_path)
+        pdfkit.configuration()  # Raises OSError when wkhtmltopdf is missing
+        _BACKEND = ('pdfkit', pdfkit)
+        return _BACKEND
     except (ImportError, OSError):
         pass
     
-    # Try pyppeteer (headless Chrome)
     try:
-        import asyncio
-        from pyppeteer import launch
+        _BACKEND = ('weasyprint', _get_pdf_converter())
+        return _BACKEND
+    except (ImportError, OSError):
+        pass
+    
+    if importlib.util.find_spec('pyppeteer') is not None:
+        _BACKEND = ('pyppeteer', _get_browser)
+        return _BACKEND
+    
+    return None
+
+
+def _pypdf_available() -> bool:
+    """Check for pypdf, which is needed to merge split renders."""
+    if importlib.util.find_spec('pypdf') is not None:
+        return True
+    print("⚠ pypdf not installed, converting without splitting (pip install pypdf)")
+    return False
+
+
+def convert_html_to_pdf(html_path: str, pdf_path: str = None,
+                        split_selector: str = None, jobs: int = None) -> str:
+    """
+    Convert HTML file to PDF using available library.
+    
+    With split_selector (e.g. 'hr.page-split') and weasyprint, the document
+    is rendered in chunks across jobs worker processes and merged.
+    """
+    html_file = Path(html_path)
+    
+    if not html_file.exists():
+        print(f"❌ HTML file not found: {html_path}")
+        return None
+    
+    if pdf_path is None:
+        pdf_path = html_file.with_suffix('.pdf')
+    
+    backend = _resolve_backend()
+    if backend is not None:
+        name, engine = backend
+        print(f"📄 Converting HTML to PDF using {name}...")
         
-        async def convert():
-            print(f"📄 Converting HTML to PDF using pyppeteer...")
-            browser = await launch()
-            page = await browser.newPage()
-            await page.goto(f'file://{html_file.absolute()}', {'waitUntil': 'networkidle0'})
-            await page.pdf({'path': str(pdf_path), 'format': 'A4', 'printBackground': True})
-            await browser.close()
+        if name == 'pdfkit':
+            options = {'encoding': 'UTF-8'}
+            engine.from_file(str(html_file), str(pdf_path), options=options)
+        elif name == 'weasyprint':
+            if split_selector and _pypdf_available():
+                engine.convert_split(html_file, pdf_path, split_selector, jobs=jobs)
+            else:
+                engine.convert(html_file, pdf_path)
+        else:
+            async def convert():
+                page = await (await _get_browser()).newPage()
+                try:
+                    await page.goto(f'file://{html_file.absolute()}', {'waitUntil': 'networkidle0'})
+                    await page.pdf({'path': str(pdf_path), 'format': 'A4', 'printBackground': True})
+                finally:
+                    await page.close()
+            
+            _run(convert())
         
-        asyncio.get_event_loop().run_until_complete(convert())
         print(f"✓ PDF created: {pdf_path}")
         return str(pdf_path)
-    except ImportError:
-        pass
     
     print("\n❌ No PDF conversion library found!")
     print("\nPlease install one of the following:")
-    print("  1. weasyprint (recommended):")
-    print("     pip install weasyprint")
-    print("\n  2. pdfkit (requires wkhtmltopdf):")
+    print("  1. pdfkit (fastest, requires wkhtmltopdf):")
     print("     pip install pdfkit")
     print("     sudo apt-get install wkhtmltopdf")
+    print("\n  2. weasyprint:")
+    print("     pip install weasyprint")
     print("\n  3. pyppeteer:")
     print("     pip install pyppeteer")
     print()
     return None
 
 
+def convert_batch(html_paths: list, jobs: int = 1) -> list:
+    """
+    Convert several HTML files to PDFs saved next to them.
+    
+    With more than one job, pages are rendered concurrently in headless
+    Chrome when pyppeteer is the backend in use; otherwise files are
+    converted one at a time.
+    """
+    missing = [p for p in html_paths if not Path(p).exists()]
+    for path in missing:
+        print(f"❌ HTML file not found: {path}")
+    pairs = [(p, Path(p).with_suffix('.pdf')) for p in html_paths if p not in missing]
+    
+    # Only batch through the browser pool when single conversions would use it too,
+    # so a faster pdfkit or weasyprint backend is never bypassed
+    backend = _resolve_backend()
+    if jobs > 1 and len(pairs) > 1 and backend is not None and backend[0] == 'pyppeteer':
+        print(f"📄 Converting {len(pairs)} HTML files to PDF using pyppeteer ({jobs} jobs)...")
+        return _run(convert_many(pairs, concurrency=jobs))
+    
+    return [convert_html_to_pdf(html, pdf) for html, pdf in pairs]
+
+
 def main():
     """Main function."""
-    if len(sys.argv) < 2:
-        html_path = "visualizations/visualizations_report.html"
-    else:
-        html_path = sys.argv[1]
+    import argparse
     
-    if len(sys.argv) >= 3:
-        pdf_path = sys.argv[2]
-    else:
-        pdf_path = None
+    parser = argparse.ArgumentParser(description='Convert HTML reports to PDF.')
+    parser.add_argument('paths', nargs='*', default=["visualizations/visualizations_report.html"],
+                        help='HTML files to convert, or a single HTML file followed by the output PDF path')
+    parser.add_argument('--jobs', type=int,
+                        help='Number of files (or split chunks) to render concurrently '
+                             '(default: 1 file at a time, one chunk per CPU)')
+    parser.add_argument('--split-on', metavar='SELECTOR',
+                        help="Render large reports in chunks split at this 'tag.class' selector, e.g. hr.page-split")
+    args = parser.parse_args()
     
-    convert_html_to_pdf(html_path, pdf_path)
+    atexit.register(_close_browser_at_exit)
+    
+    if len(args.paths) == 2 and args.paths[1].lower().endswith('.pdf'):
+        convert_html_to_pdf(args.paths[0], args.paths[1], split_selector=args.split_on, jobs=args.jobs)
+    elif len(args.paths) == 1:
+        convert_html_to_pdf(args.paths[0], split_selector=args.split_on, jobs=args.jobs)
+    else:
+        convert_batch(args.paths, jobs=args.jobs or 1)
 
 
 if __name__ == "__main__":
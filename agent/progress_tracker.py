@@ -3,13 +3,58 @@ QA Progress Tracker
 Analyzes multiple timestamped CSV files to track testing progress over time.
 """
 
+import numpy as np
 import pandas as pd
 import glob
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict
 import sys
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
+
+# Timestamp format written by qa_analyzer.save_to_csv
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# pd.read_csv options: parse timestamps and fix dtypes in the C reader instead of afterwards
+READ_CSV_OPTIONS = {
+    'parse_dates': ['timestamp'],
+    'date_format': TIMESTAMP_FORMAT,
+    'dtype': {
+        'sheet_name': 'category',
+        'pass_count': 'uint32',
+        'fail_count': 'uint32',
+        'not_available_count': 'uint32',
+        'unknown_count': 'uint32',
+        'total_tests': 'uint32',
+        'has_results': 'bool'
+    }
+}
+
+# Count columns summed per snapshot
+COUNT_COLUMNS = ['pass_count', 'fail_count', 'unknown_count', 'total_tests']
+
+# qa_analyzer writes "not available" counts; the tracker reports them as unknown
+LEGACY_COLUMN_NAMES = {
+    'not_available_count': 'unknown_count',
+    'not_available_percentage': 'unknown_percentage'
+}
+
+
+def _percentages(counts, totals) -> np.ndarray:
+    """Compute counts / totals * 100 in one pass, yielding 0 where the total is 0."""
+    counts = np.asarray(counts, dtype=np.float64)
+    totals = np.asarray(totals, dtype=np.float64)
+    return np.divide(counts, totals, out=np.zeros_like(counts), where=totals != 0) * 100.0
+
 
 class ProgressTracker:
     """Tracks QA testing progress across multiple timestamped CSV files."""
@@ -19,6 +64,13 @@ class ProgressTracker:
         self.csv_directory = Path(csv_directory)
         self.csv_files = []
         self.combined_data = None
+        self._with_results = None
+        self._ts_group = None
+        self._unique_ts = None
+        self._first_ts = None
+        self._latest_ts = None
+        self._report_cache_key = None
+        self._report_cache = None
         
     def load_csv_files(self, pattern: str = "qa_results_*.csv") -> bool:
         """Load all timestamped CSV files matching the pattern."""
@@ -31,38 +83,74 @@ class ProgressTracker:
         
         print(f"✓ Found {len(self.csv_files)} CSV files")
         
-        # Load and combine all CSV files
-        dfs = []
-        for csv_file in self.csv_files:
-            df = pd.read_csv(csv_file)
-            dfs.append(df)
-        
-        self.combined_data = pd.concat(dfs, ignore_index=True)
-        
-        # Convert timestamp to datetime
-        self.combined_data['timestamp'] = pd.to_datetime(self.combined_data['timestamp'])
-        
-        print(f"✓ Loaded data from {self.combined_data['timestamp'].min()} to {self.combined_data['timestamp'].max()}")
+        # Load and combine all CSV files (files are independent, so read them in parallel)
+        workers = min(len(self.csv_files), os.cpu_count() or 1)
+        if pa is not None:
+            # Parse in Arrow's C++ reader (timestamps included) and convert to pandas once.
+            # The reader releases the GIL, so threads are enough. The timestamp type is pinned
+            # to nanoseconds so the frame matches what pd.read_csv produces.
+            convert_options = pacsv.ConvertOptions(column_types={'timestamp': pa.timestamp('ns')},
+                                                   timestamp_parsers=[TIMESTAMP_FORMAT])
+            read_table = partial(pacsv.read_csv, convert_options=convert_options)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                tables = list(executor.map(read_table, self.csv_files))
+            combined = pa.concat_tables(tables, promote_options='permissive')
+            self.combined_data = combined.to_pandas()
+        else:
+            read_frame = partial(pd.read_csv, **READ_CSV_OPTIONS)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                dfs = list(executor.map(read_frame, self.csv_files, chunksize=4))
+            
+            self.combined_data = pd.concat(dfs, ignore_index=True)
+        
+        for old_name, new_name in LEGACY_COLUMN_NAMES.items():
+            if old_name in self.combined_data.columns and new_name not in self.combined_data.columns:
+                self.combined_data = self.combined_data.rename(columns={old_name: new_name})
+        
+        self._compact_columns()
+        self._build_aggregates()
+        self._report_cache_key = None
+        self._report_cache = None
+        
+        print(f"✓ Loaded data from {self._first_ts} to {self._latest_ts}")
         print()
         return True
     
+    def _compact_columns(self):
+        """Store low-cardinality text as categoricals and counts as the smallest signed ints.
+        
+        Signed types keep differences between counts (e.g. run-to-run deltas) from wrapping around.
+        """
+        data = self.combined_data
+        for column in ('sheet_name', 'status'):
+            if column in data.columns:
+                data[column] = data[column].astype('category')
+        for column in COUNT_COLUMNS:
+            if column in data.columns:
+                data[column] = pd.to_numeric(data[column], downcast='integer')
+    
+    def _build_aggregates(self):
+        """Precompute the filtered views and snapshot timestamps the getters share."""
+        data = self.combined_data
+        self._with_results = data[data['has_results'] == True]
+        self._ts_group = self._with_results.groupby('timestamp', sort=True)
+        self._unique_ts = data['timestamp'].unique()
+        self._first_ts = self._unique_ts.min()
+        self._latest_ts = self._unique_ts.max()
+    
     def get_overall_progress(self) -> pd.DataFrame:
         """Get overall progress across all sheets over time."""
         if self.combined_data is None:
             return None
         
-        # Group by timestamp and calculate totals
-        progress = self.combined_data[self.combined_data['has_results'] == True].groupby('timestamp').agg({
-            'pass_count': 'sum',
-            'fail_count': 'sum',
-            'unknown_count': 'sum',
-            'total_tests': 'sum'
-        }).reset_index()
+        # Group by timestamp and calculate totals (as int64 whatever width the counts were loaded with)
+        progress = self._ts_group[COUNT_COLUMNS].sum().astype('int64').reset_index()
         
-        # Calculate percentages
-        progress['pass_percentage'] = (progress['pass_count'] / progress['total_tests'] * 100).round(2)
-        progress['fail_percentage'] = (progress['fail_count'] / progress['total_tests'] * 100).round(2)
-        progress['unknown_percentage'] = (progress['unknown_count'] / progress['total_tests'] * 100).round(2)
+        # Calculate all three percentages in a single vectorized kernel
+        counts = progress[['pass_count', 'fail_count', 'unknown_count']].to_numpy()
+        totals = progress['total_tests'].to_numpy()[:, None]
+        pct = np.round(_percentages(counts, totals), 2)
+        progress[['pass_percentage', 'fail_percentage', 'unknown_percentage']] = pct
         
         return progress
     
@@ -81,34 +169,21 @@ class ProgressTracker:
         if self.combined_data is None:
             return None
         
-        latest_timestamp = self.combined_data['timestamp'].max()
-        return self.combined_data[self.combined_data['timestamp'] == latest_timestamp]
+        return self.combined_data[self.combined_data['timestamp'] == self._latest_ts]
     
     def compare_first_and_last(self) -> Dict:
         """Compare the first and last snapshots to show overall progress."""
-        if self.combined_data is None or len(self.combined_data['timestamp'].unique()) < 2:
+        if self.combined_data is None or self._unique_ts.size < 2:
             return None
         
-        first_timestamp = self.combined_data['timestamp'].min()
-        last_timestamp = self.combined_data['timestamp'].max()
-        
-        first_data = self.combined_data[self.combined_data['timestamp'] == first_timestamp]
-        last_data = self.combined_data[self.combined_data['timestamp'] == last_timestamp]
+        first_timestamp = self._first_ts
+        last_timestamp = self._latest_ts
         
-        # Calculate totals for sheets with results
-        first_totals = first_data[first_data['has_results'] == True].agg({
-            'pass_count': 'sum',
-            'fail_count': 'sum',
-            'unknown_count': 'sum',
-            'total_tests': 'sum'
-        })
-        
-        last_totals = last_data[last_data['has_results'] == True].agg({
-            'pass_count': 'sum',
-            'fail_count': 'sum',
-            'unknown_count': 'sum',
-            'total_tests': 'sum'
-        })
+        # Calculate totals for sheets with results in one grouped pass; a snapshot
+        # without any results is missing from the groups and counts as zeros
+        totals = self._ts_group[COUNT_COLUMNS].sum().reindex([first_timestamp, last_timestamp], fill_value=0)
+        first_totals = totals.iloc[0]
+        last_totals = totals.iloc[1]
         
         return {
             'first_timestamp': first_timestamp,
@@ -116,106 +191,121 @@ class ProgressTracker:
             'first': first_totals.to_dict(),
             'last': last_totals.to_dict(),
             'changes': {
-                'pass_change': int(last_totals['pass_count'] - first_totals['pass_count']),
-                'fail_change': int(last_totals['fail_count'] - first_totals['fail_count']),
-                'unknown_change': int(last_totals['unknown_count'] - first_totals['unknown_count']),
-                'total_change': int(last_totals['total_tests'] - first_totals['total_tests'])
+                'pass_change': int(last_totals['pass_count']) - int(first_totals['pass_count']),
+                'fail_change': int(last_totals['fail_count']) - int(first_totals['fail_count']),
+                'unknown_change': int(last_totals['unknown_count']) - int(first_totals['unknown_count']),
+                'total_change': int(last_totals['total_tests']) - int(first_totals['total_tests'])
             }
         }
     
-    def generate_progress_report(self) -> str:
-        """Generate a comprehensive progress report."""
-        if self.combined_data is None:
-            return "No data loaded"
-        
-        report_lines = []
-        report_lines.append("=" * 70)
-        report_lines.append("QA TESTING PROGRESS REPORT")
-        report_lines.append("=" * 70)
-        report_lines.append(f"Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report_lines.append(f"CSV Files Analyzed: {len(self.csv_files)}")
-        report_lines.append("")
+    def _current_cache_key(self) -> tuple:
+        """Identify the loaded inputs by file name and modification time (None once a file is removed)."""
+        key = []
+        for csv_file in self.csv_files:
+            try:
+                key.append((csv_file, os.path.getmtime(csv_file)))
+            except FileNotFoundError:
+                key.append((csv_file, None))
+        return tuple(key)
+    
+    def _iter_report_lines(self):
+        """Yield the progress report as consecutive blocks of lines, without building it in memory."""
+        rule = "=" * 70
+        divider = "-" * 70
+        
+        yield (f"{rule}\n"
+               f"QA TESTING PROGRESS REPORT\n"
+               f"{rule}\n"
+               f"Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+               f"CSV Files Analyzed: {len(self.csv_files)}\n"
+               f"\n")
         
         # Time range
-        time_range = f"{self.combined_data['timestamp'].min()} to {self.combined_data['timestamp'].max()}"
-        report_lines.append(f"Time Period: {time_range}")
-        report_lines.append("")
+        yield f"Time Period: {self._first_ts} to {self._latest_ts}\n\n"
         
         # Latest snapshot
         latest = self.get_latest_snapshot()
         latest_timestamp = latest['timestamp'].iloc[0]
-        report_lines.append("CURRENT STATUS (Latest Run)")
-        report_lines.append("-" * 70)
-        report_lines.append(f"As of: {latest_timestamp}")
         
         latest_with_results = latest[latest['has_results'] == True]
-        total_pass = int(latest_with_results['pass_count'].sum())
-        total_fail = int(latest_with_results['fail_count'].sum())
-        total_unknown = int(latest_with_results['unknown_count'].sum())
-        total_tests = int(latest_with_results['total_tests'].sum())
-        
-        report_lines.append(f"Total Test Cases: {total_tests}")
-        report_lines.append(f"  ✓ Passed: {total_pass} ({total_pass/total_tests*100:.1f}%)" if total_tests > 0 else "  ✓ Passed: 0")
-        report_lines.append(f"  ✗ Failed: {total_fail} ({total_fail/total_tests*100:.1f}%)" if total_tests > 0 else "  ✗ Failed: 0")
-        report_lines.append(f"  ? Unknown/Pending: {total_unknown} ({total_unknown/total_tests*100:.1f}%)" if total_tests > 0 else "  ? Unknown/Pending: 0")
-        report_lines.append("")
+        total_pass, total_fail, total_unknown, total_tests = (
+            int(total) for total in latest_with_results[COUNT_COLUMNS].sum()
+        )
+        pass_pct, fail_pct, unknown_pct = _percentages([total_pass, total_fail, total_unknown], total_tests)
+        
+        yield (f"CURRENT STATUS (Latest Run)\n"
+               f"{divider}\n"
+               f"As of: {latest_timestamp}\n"
+               f"Total Test Cases: {total_tests}\n"
+               f"  ✓ Passed: {total_pass} ({pass_pct:.1f}%)\n"
+               f"  ✗ Failed: {total_fail} ({fail_pct:.1f}%)\n"
+               f"  ? Unknown/Pending: {total_unknown} ({unknown_pct:.1f}%)\n"
+               f"\n")
         
         # Progress over time (if multiple snapshots)
-        if len(self.combined_data['timestamp'].unique()) > 1:
+        if self._unique_ts.size > 1:
             comparison = self.compare_first_and_last()
             if comparison:
-                report_lines.append("PROGRESS OVER TIME")
-                report_lines.append("-" * 70)
-                report_lines.append(f"From: {comparison['first_timestamp']}")
-                report_lines.append(f"To:   {comparison['last_timestamp']}")
-                report_lines.append("")
-                
                 changes = comparison['changes']
-                report_lines.append("Changes:")
-                report_lines.append(f"  Total Tests: {changes['total_change']:+d}")
-                report_lines.append(f"  Passed: {changes['pass_change']:+d}")
-                report_lines.append(f"  Failed: {changes['fail_change']:+d}")
-                report_lines.append(f"  Unknown/Pending: {changes['unknown_change']:+d}")
-                report_lines.append("")
+                yield (f"PROGRESS OVER TIME\n"
+                       f"{divider}\n"
+                       f"From: {comparison['first_timestamp']}\n"
+                       f"To:   {comparison['last_timestamp']}\n"
+                       f"\n"
+                       f"Changes:\n"
+                       f"  Total Tests: {changes['total_change']:+d}\n"
+                       f"  Passed: {changes['pass_change']:+d}\n"
+                       f"  Failed: {changes['fail_change']:+d}\n"
+                       f"  Unknown/Pending: {changes['unknown_change']:+d}\n"
+                       f"\n")
                 
                 # Trend analysis
                 overall_progress = self.get_overall_progress()
                 if len(overall_progress) > 1:
-                    report_lines.append("TREND ANALYSIS")
-                    report_lines.append("-" * 70)
-                    report_lines.append("")
-                    report_lines.append("Date                    | Total | Pass | Fail | Unknown | Pass%")
-                    report_lines.append("-" * 70)
+                    yield (f"TREND ANALYSIS\n"
+                           f"{divider}\n"
+                           f"\n"
+                           f"Date                    | Total | Pass | Fail | Unknown | Pass%\n"
+                           f"{divider}\n")
                     
-                    for _, row in overall_progress.iterrows():
-                        ts = row['timestamp'].strftime('%Y-%m-%d %H:%M:%S')
-                        report_lines.append(
-                            f"{ts} | {int(row['total_tests']):5d} | "
-                            f"{int(row['pass_count']):4d} | {int(row['fail_count']):4d} | "
-                            f"{int(row['unknown_count']):7d} | {row['pass_percentage']:5.1f}%"
-                        )
-                    report_lines.append("")
+                    for row in overall_progress.itertuples(index=False):
+                        yield (f"{row.timestamp:%Y-%m-%d %H:%M:%S} | {int(row.total_tests):5d} | "
+                               f"{int(row.pass_count):4d} | {int(row.fail_count):4d} | "
+                               f"{int(row.unknown_count):7d} | {row.pass_percentage:5.1f}%\n")
+                    yield "\n"
         
         # Per-sheet summary
-        report_lines.append("SHEET-BY-SHEET CURRENT STATUS")
-        report_lines.append("-" * 70)
-        
-        for _, row in latest.iterrows():
-            report_lines.append(f"\n📄 {row['sheet_name']}")
-            if row['has_results']:
-                report_lines.append(f"   Total Tests: {int(row['total_tests'])}")
-                report_lines.append(f"   ✓ Pass: {int(row['pass_count'])} ({row['pass_percentage']:.1f}%)")
-                report_lines.append(f"   ✗ Fail: {int(row['fail_count'])} ({row['fail_percentage']:.1f}%)")
-                report_lines.append(f"   ? Unknown: {int(row['unknown_count'])} ({row['unknown_percentage']:.1f}%)")
+        yield (f"SHEET-BY-SHEET CURRENT STATUS\n"
+               f"{divider}\n")
+        
+        for row in latest.itertuples(index=False):
+            yield f"\n📄 {row.sheet_name}\n"
+            if row.has_results:
+                yield (f"   Total Tests: {int(row.total_tests)}\n"
+                       f"   ✓ Pass: {int(row.pass_count)} ({row.pass_percentage:.1f}%)\n"
+                       f"   ✗ Fail: {int(row.fail_count)} ({row.fail_percentage:.1f}%)\n"
+                       f"   ? Unknown: {int(row.unknown_count)} ({row.unknown_percentage:.1f}%)\n")
             else:
-                report_lines.append(f"   Status: {row['status']}")
+                yield f"   Status: {row.status}\n"
         
-        report_lines.append("")
-        report_lines.append("=" * 70)
-        report_lines.append("END OF PROGRESS REPORT")
-        report_lines.append("=" * 70)
+        yield (f"\n"
+               f"{rule}\n"
+               f"END OF PROGRESS REPORT\n"
+               f"{rule}")
+    
+    def generate_progress_report(self) -> str:
+        """Generate a comprehensive progress report."""
+        if self.combined_data is None:
+            return "No data loaded"
+        
+        # The report only depends on the loaded CSVs, so reuse it until they change
+        key = self._current_cache_key()
+        if self._report_cache_key == key:
+            return self._report_cache
         
-        return "\n".join(report_lines)
+        self._report_cache_key = key
+        self._report_cache = "".join(self._iter_report_lines())
+        return self._report_cache
     
     def save_progress_report(self, output_path: str = None) -> str:
         """Save the progress report to a file."""
@@ -223,10 +313,14 @@ class ProgressTracker:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             output_path = f"progress_report_{timestamp}.txt"
         
-        report = self.generate_progress_report()
-        
+        # Stream the report straight to disk unless it has already been rendered
         with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(report)
+            if self.combined_data is None:
+                f.write(self.generate_progress_report())
+            elif self._report_cache_key == self._current_cache_key():
+                f.write(self._report_cache)
+            else:
+                f.writelines(self._iter_report_lines())
         
         print(f"\n✓ Progress report saved to: {output_path}")
         return output_path
@@ -240,18 +334,43 @@ class ProgressTracker:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             output_path = f"combined_history_{timestamp}.csv"
         
-        self.combined_data.to_csv(output_path, index=False)
+        if pa is not None:
+            # Arrow's C++ writer formats rows in batches instead of one Python call per cell
+            table = pa.Table.from_pandas(self.combined_data, preserve_index=False)
+            pacsv.write_csv(table, output_path, write_options=pacsv.WriteOptions(batch_size=16384))
+        else:
+            self.combined_data.to_csv(output_path, index=False)
+        print(f"✓ Combined history saved to: {output_path}")
+        return output_path
+    
+    def export_combined_parquet(self, output_path: str = None) -> str:
+        """
+        Export all combined data to a single Parquet file.
+        
+        Parquet keeps the column types (timestamps, categoricals, unsigned
+        counts), is much smaller than CSV and reloads far faster.
+        """
+        if self.combined_data is None:
+            return None
+        
+        if output_path is None:
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            output_path = f"combined_history_{timestamp}.parquet"
+        
+        self.combined_data.to_parquet(output_path, engine='pyarrow', compression='zstd',
+                                      use_dictionary=True, index=False)
         print(f"✓ Combined history saved to: {output_path}")
         return output_path
 
 
 def main():
     """Main function to run the progress tracker."""
-    # Allow specifying directory as argument
+    # Allow specifying directory (and combined history output path) as arguments
     if len(sys.argv) > 1:
         csv_directory = sys.argv[1]
     else:
         csv_directory = "."
+    history_path = sys.argv[2] if len(sys.argv) > 2 else None
     
     # Create tracker
     tracker = ProgressTracker(csv_directory)
@@ -267,7 +386,12 @@ def main():
     
     # Save report
     tracker.save_progress_report()
-    tracker.export_combined_csv()
+    
+    # Combined history is written as Parquet unless a .csv path is requested explicitly
+    if (history_path and history_path.lower().endswith('.csv')) or pa is None:
+        tracker.export_combined_csv(history_path)
+    else:
+        tracker.export_combined_parquet(history_path)
 
 
 if __name__ == "__main__":
@@ -3,13 +3,40 @@ QA Testing Results Analyzer
 Reads Excel sheets, identifies pass/fail results, and generates comprehensive summaries.
 """
 
+import numpy as np
+import openpyxl
 import pandas as pd
+import io
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from collections import Counter
+from contextlib import redirect_stdout
+from functools import cached_property, lru_cache
+from itertools import repeat
 from pathlib import Path
 from typing import Dict, List, Tuple, Any
 import json
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import python_calamine
+except ImportError:
+    python_calamine = None
+
+
+# calamine (Rust) parses XLSX far faster than openpyxl; fall back when it isn't installed
+EXCEL_ENGINE = 'calamine' if python_calamine is not None else 'openpyxl'
+
+# Each worker process opens its own copy of the workbook, so more workers than this
+# costs more in repeated workbook loading than it gains in parallel parsing
+MAX_SHEET_WORKERS = 8
+
 
 # QA Team Configuration - Specific sheets and columns to analyze
 # Maps sheet names to their result columns (using Excel column letters)
@@ -45,10 +72,21 @@ QA_SHEET_CONFIG = {
     'Report': ['AD']                                 # Column AD (index 29)
 }
 
+# Cell classifications, in the order of the int8 codes used when counting a column
+CLASSIFICATIONS = ['pass', 'fail', 'not_available', 'invalid']
+_CLASSIFICATION_CODES = {name: code for code, name in enumerate(CLASSIFICATIONS)}
+INVALID_CODE = _CLASSIFICATION_CODES['invalid']
+
+# Per-column summary counts, in the order they are combined across columns
+SUMMARY_COUNT_KEYS = ['pass_count', 'fail_count', 'not_available_count', 'invalid_count', 'total_rows']
+
 
 class QAAnalyzer:
     """Analyzes QA testing results from Excel spreadsheets with ad hoc formats."""
     
+    # Print per-column classification tallies and sample values while analyzing
+    DEBUG = False
+    
     # Keywords to identify pass/fail columns
     RESULT_KEYWORDS = ['result', 'status', 'outcome', 'pass', 'fail', 'test result', 
                        'qa result', 'test status', 'qa status', 'verdict', 'n/a']
@@ -81,30 +119,49 @@ class QAAnalyzer:
         r'\bnot (started|done|completed)\b'
     ]
     
+    # Matched against the lowercased value, so these are case-sensitive
     NOT_AVAILABLE_PATTERNS = [
-        r'\bn[/\-\s]?a\b',  # Matches: n/a, n-a, n a, na
-        r'\bnot[\s\-_]?available\b',
-        r'\bnot[\s\-_]?applicable\b',
-        r'\bN/A\b',
-        r'\bNA\b',
-        r'\bn/a\b'
+        r'n/a',               # "n/a" anywhere, even inside other text
+        r'\bn[/\-\s]?a\b',    # Matches: n/a, n-a, n a, na
+        r'^not available$',
+        r'^not applicable$'
     ]
     
-    def __init__(self, excel_path: str, sheet_config: Dict[str, List[str]] = None):
+    def __init__(self, excel_path: str, sheet_config: Dict[str, List[str]] = None, stream_mode: bool = False):
         """Initialize the analyzer with an Excel file path and optional sheet configuration.
         
         Args:
             excel_path: Path to the Excel file
             sheet_config: Dictionary mapping sheet names to list of column letters (e.g., {'SMS': ['I'], 'CF1': ['J', 'K']})
                          If None, will auto-detect columns (legacy behavior)
+            stream_mode: Classify configured columns straight from a read-only openpyxl sheet
+                         instead of a DataFrame, keeping memory flat on very large sheets
         """
         self.excel_path = Path(excel_path)
-        self.workbook = None
         self.sheet_names = []
         self.analysis_results = {}
         self.sheet_config = sheet_config
+        self.stream_mode = stream_mode
+        
+        # One timestamp per run, so the summary, JSON and CSV outputs share a file suffix
+        self._run_time = datetime.now()
+        self._run_ts = self._run_time.strftime('%Y%m%d_%H%M%S')
+    
+    @property
+    def sheet_config(self) -> Dict[str, List[str]]:
+        """Configured result column letters per sheet (None in auto-detect mode)."""
+        return self._sheet_config
+    
+    @sheet_config.setter
+    def sheet_config(self, sheet_config: Dict[str, List[str]]) -> None:
+        self._sheet_config = sheet_config
+        # Column indices and the report label are fixed per sheet, so work them out once
+        self._col_indices = {sheet: [self.column_letter_to_index(letter) for letter in letters]
+                             for sheet, letters in (sheet_config or {}).items()}
+        self._column_labels = {sheet: ' + '.join(letters) for sheet, letters in (sheet_config or {}).items()}
         
     @staticmethod
+    @lru_cache(maxsize=256)
     def column_letter_to_index(letter: str) -> int:
         """Convert Excel column letter(s) to zero-based index.
         
@@ -115,11 +172,27 @@ class QAAnalyzer:
             result = result * 26 + (ord(char) - ord('A') + 1)
         return result - 1
         
+    def __enter__(self) -> 'QAAnalyzer':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    @cached_property
+    def workbook(self) -> pd.ExcelFile:
+        """The workbook handle, opened on first use and shared by every sheet parse."""
+        return pd.ExcelFile(self.excel_path, engine=EXCEL_ENGINE)
+    
+    def close(self) -> None:
+        """Close the workbook handle if it has been opened."""
+        workbook = self.__dict__.pop('workbook', None)
+        if workbook is not None:
+            workbook.close()
+    
     def load_workbook(self) -> bool:
         """Load the Excel workbook and get sheet names."""
         try:
             # Get all sheet names
-            self.workbook = pd.ExcelFile(self.excel_path)
             self.sheet_names = self.workbook.sheet_names
             print(f"✓ Loaded workbook: {self.excel_path.name}")
             print(f"  Found {len(self.sheet_names)} sheets: {', '.join(self.sheet_names)}\n")
@@ -148,19 +221,31 @@ class QAAnalyzer:
     
     def _column_has_pass_fail_values(self, series: pd.Series) -> bool:
         """Check if a column contains pass/fail/not available values."""
+        # Numeric, boolean and date columns can never hold pass/fail text
+        if not (series.dtype == object or pd.api.types.is_string_dtype(series)):
+            return False
+        
         # Sample non-null values
-        sample = series.dropna().astype(str).str.lower().head(100)
+        sample = series.dropna().head(100)
         if len(sample) == 0:
             return False
         
-        # Count how many values match pass/fail/not available patterns
+        # If more than 30% of sampled values are pass/fail/not available, consider it a result column.
+        # Distinct values are classified most frequent first, stopping as soon as the
+        # outcome is settled either way.
+        needed = int(0.3 * len(sample)) + 1
         matches = 0
-        for value in sample:
-            if self._classify_value(value) in ['pass', 'fail', 'not_available']:
-                matches += 1
-        
-        # If more than 30% of sampled values are pass/fail/not available, consider it a result column
-        return (matches / len(sample)) > 0.3
+        remaining = len(sample)
+        for value, count in sample.value_counts(sort=True).items():
+            remaining -= count
+            # dropna() already removed missing values, so go straight to the string path
+            if self._classify_str(str(value).strip()) != 'invalid':
+                matches += count
+                if matches >= needed:
+                    return True
+            elif matches + remaining < needed:
+                return False
+        return False
     
     def _classify_value(self, value: str) -> str:
         """Classify a value as pass, fail, not_available, or invalid.
@@ -171,44 +256,35 @@ class QAAnalyzer:
             'not_available' - Explicitly marked as n/a
             'invalid' - Empty cells or unrecognized values (not counted)
         """
-        # Empty cells or truly missing values are invalid (not counted)
-        # With keep_default_na=False, empty cells come as empty strings
-        if pd.isna(value) or value == '':
+        # Cells are almost always strings, so skip the pandas missing-value check for them
+        if isinstance(value, str):
+            return self._classify_str(value.strip())
+        if pd.isna(value):
+            # Empty cells or truly missing values are invalid (not counted)
             return 'invalid'
-        
-        value_str = str(value).strip()
-        
-        # Empty string after stripping whitespace
-        if value_str == '':
+        return self._classify_str(str(value).strip())
+    
+    @staticmethod
+    def _classify_str(value_str: str) -> str:
+        """Classify an already-stripped string cell value (see _classify_value)."""
+        # Empty string, or only whitespace
+        if not value_str:
             return 'invalid'
         
-        # Replace line breaks and multiple spaces with single space for easier matching
-        value_clean = re.sub(r'\s+', ' ', value_str).strip()
-        value_lower = value_clean.lower()
-        
-        # Check for n/a patterns FIRST (before pass/fail)
-        # Now that we use keep_default_na=False, "n/a" will come as the string "n/a"
-        if value_lower in ['n/a', 'na', 'n-a', 'n a', 'not available', 'not applicable']:
-            return 'not_available'
-        
-        if 'n/a' in value_lower:
-            return 'not_available'
-        
-        if re.search(r'\bn[/\-\s]?a\b', value_lower):
-            return 'not_available'
-        
-        # Check pass patterns
-        for pattern in self.PASS_PATTERNS:
-            if re.search(pattern, value_lower, re.IGNORECASE):
-                return 'pass'
+        # Replace line breaks and multiple spaces with single space for easier matching.
+        # Single-word values skip the regex: every whitespace character other than ' '
+        # is non-printable, so isprintable() rules out tabs, newlines and Unicode spaces.
+        # (value_str is already stripped, so the result needs no second strip.)
+        if ' ' in value_str or not value_str.isprintable():
+            value_str = _WS_RE.sub(' ', value_str)
+        value_lower = value_str.lower()
         
-        # Check fail patterns
-        for pattern in self.FAIL_PATTERNS:
-            if re.search(pattern, value_lower, re.IGNORECASE):
-                return 'fail'
+        # Canonical tokens ("pass", "fail", "n/a", ...) resolve with a single dict lookup
+        hit = _FAST_MAP.get(value_lower)
+        if hit is not None:
+            return hit
         
-        # Anything else is invalid (not counted in analysis)
-        return 'invalid'
+        return _classify_normalized(value_lower)
     
     def analyze_sheet(self, sheet_name: str) -> Dict[str, Any]:
         """Analyze a single sheet for pass/fail results."""
@@ -217,28 +293,57 @@ class QAAnalyzer:
         try:
             # Read the sheet - keep_default_na=False prevents "n/a" from being converted to NaN
             # We want to see "n/a" as a string, not as a missing value
-            df = pd.read_excel(self.excel_path, sheet_name=sheet_name, keep_default_na=False, na_values=[''])
+            # Parsing through the workbook opened in load_workbook avoids re-opening the file per sheet
+            read_options = {'keep_default_na': False, 'na_values': ['']}
+            configured = bool(self.sheet_config) and sheet_name in self.sheet_config
+            
+            if configured:
+                # Only the configured result columns need parsing; the header row alone
+                # gives the column names and the sheet width
+                columns = list(self.workbook.parse(sheet_name, nrows=0, **read_options).columns)
+                df = None
+                if any(idx >= len(columns) for idx in self._col_indices[sheet_name]):
+                    # Data can extend past the last header cell, and only a full parse shows the
+                    # sheet's real width, so a configured column out there is never dropped
+                    df = self.workbook.parse(sheet_name, dtype=str, **read_options)
+                    columns = list(df.columns)
+                needed = sorted({idx for idx in self._col_indices[sheet_name] if idx < len(columns)})
+                if df is not None:
+                    df = df.iloc[:, needed]
+                    total_rows = len(df)
+                elif self.stream_mode:
+                    df = None
+                    streamed_counts, total_rows = self._stream_column_counts(sheet_name, needed)
+                else:
+                    # Result cells are classified as text anyway, so skip dtype inference
+                    df = self.workbook.parse(sheet_name, usecols=needed or None, dtype=str, **read_options)
+                    if needed:
+                        # Keep the names the full header gives (e.g. de-duplicated "Status.1")
+                        df.columns = [columns[idx] for idx in needed]
+                    total_rows = len(df)
+            else:
+                df = self.workbook.parse(sheet_name, **read_options)
+                columns = list(df.columns)
+                total_rows = len(df)
             
             # Basic info
-            total_rows = len(df)
-            total_columns = len(df.columns)
+            total_columns = len(columns)
             
             print(f"  Rows: {total_rows}, Columns: {total_columns}")
             
             # Identify result columns based on config or auto-detection
-            if self.sheet_config and sheet_name in self.sheet_config:
+            if configured:
                 # Use configured columns
                 column_letters = self.sheet_config[sheet_name]
                 result_columns = []
                 column_mapping = []  # Track letter -> actual column name mapping
-                for letter in column_letters:
-                    col_idx = self.column_letter_to_index(letter)
-                    if col_idx < len(df.columns):
-                        actual_col_name = df.columns[col_idx]
+                for letter, col_idx in zip(column_letters, self._col_indices[sheet_name]):
+                    if col_idx < total_columns:
+                        actual_col_name = columns[col_idx]
                         result_columns.append(actual_col_name)
                         column_mapping.append(f"Column {letter} (index {col_idx}) -> '{actual_col_name}'")
                     else:
-                        print(f"  ⚠ Column {letter} (index {col_idx}) out of range - sheet only has {len(df.columns)} columns")
+                        print(f"  ⚠ Column {letter} (index {col_idx}) out of range - sheet only has {total_columns} columns")
                 
                 if result_columns:
                     print(f"  ✓ Using configured columns:")
@@ -264,19 +369,22 @@ class QAAnalyzer:
             # Analyze each result column
             column_summaries = {}
             for col in result_columns:
-                summary = self._analyze_result_column(df, col)
+                if df is None:
+                    counts = streamed_counts[columns.index(col)]
+                    summary = self._column_summary(counts['pass'], counts['fail'],
+                                                   counts['not_available'], total_rows)
+                else:
+                    summary = self._analyze_result_column(df, col)
                 column_summaries[col] = summary
             
             # Calculate overall summary
             # If multiple columns configured, combine their results
             if len(result_columns) > 1:
                 # Combine counts from all configured columns
-                combined_pass = sum(column_summaries[col]['pass_count'] for col in result_columns)
-                combined_fail = sum(column_summaries[col]['fail_count'] for col in result_columns)
-                combined_na = sum(column_summaries[col]['not_available_count'] for col in result_columns)
-                combined_invalid = sum(column_summaries[col]['invalid_count'] for col in result_columns)
+                counts = np.array([[column_summaries[col][key] for key in SUMMARY_COUNT_KEYS]
+                                   for col in result_columns])
+                combined_pass, combined_fail, combined_na, combined_invalid, combined_rows = counts.sum(axis=0).tolist()
                 combined_total = combined_pass + combined_fail + combined_na
-                combined_rows = sum(column_summaries[col]['total_rows'] for col in result_columns)
                 
                 primary_summary = {
                     'pass_count': combined_pass,
@@ -293,10 +401,7 @@ class QAAnalyzer:
                 primary_summary = column_summaries[primary_col]
             
             # Track configured column letter(s) if available
-            configured_column_letter = None
-            if self.sheet_config and sheet_name in self.sheet_config:
-                letters = self.sheet_config[sheet_name]
-                configured_column_letter = ' + '.join(letters) if len(letters) > 1 else letters[0]
+            configured_column_letter = self._column_labels.get(sheet_name)
             
             if len(result_columns) > 1:
                 print(f"  📊 Combined Results from {len(result_columns)} columns:")
@@ -341,58 +446,86 @@ class QAAnalyzer:
         Only counts valid test results (pass, fail, or explicit n/a).
         Empty cells and unrecognized values are excluded from the total.
         """
-        pass_count = 0
-        fail_count = 0
-        not_available_count = 0
-        invalid_count = 0
-        
-        # Debug: sample some values to see what we're working with
-        sample_values = []
-        value_types = {}
+        values = df[column]
+        # Missing cells get no code, so they end up in the invalid count
+        codes = self._classification_codes(values)
+        pass_count, fail_count, not_available_count, _ = np.bincount(codes, minlength=len(CLASSIFICATIONS)).tolist()
+        
+        if self.DEBUG:
+            # Cell-by-cell tally with sample values, for checking the masks against _classify_value
+            value_types = Counter()
+            samples = {}
+            for value in values:
+                classification = self._classify_value(value)
+                value_types[classification] += 1
+                samples.setdefault(classification, repr(value)[:50])
+            print(f"  [DEBUG] Classification counts: {dict(value_types)}")
+            print(f"  [DEBUG] Sample values:")
+            for classification, sample in list(samples.items())[:5]:
+                print(f"         {sample} -> {classification}")
         
-        for value in df[column]:
-            classification = self._classify_value(value)
-            
-            # Track classification types
-            value_types[classification] = value_types.get(classification, 0) + 1
-            
-            # Debug: collect samples from each classification type
-            if classification not in [s.split(' -> ')[1] for s in sample_values]:
-                if len(sample_values) < 10:
-                    repr_val = repr(value)[:50]  # First 50 chars
-                    sample_values.append(f"{repr_val} -> {classification}")
-            
-            if classification == 'pass':
-                pass_count += 1
-            elif classification == 'fail':
-                fail_count += 1
-            elif classification == 'not_available':
-                not_available_count += 1
-            else:
-                # Invalid entries (empty, unrecognized text) - not counted in total
-                invalid_count += 1
+        return self._column_summary(pass_count, fail_count, not_available_count, len(df))
+    
+    def _classification_codes(self, values: pd.Series) -> np.ndarray:
+        """Classify the non-missing values of a column.
         
+        Returns an int8 array with one index into CLASSIFICATIONS per non-missing value.
+        """
+        # Result columns hold only a handful of distinct values, so each distinct value
+        # is classified once and the codes are spread back over the rows
+        row_codes, uniques = pd.factorize(values[values.notna()])
+        lookup = np.array([_CLASSIFICATION_CODES[self._classify_str(str(value).strip())] for value in uniques],
+                          dtype=np.int8)
+        return lookup[row_codes]
+    
+    @staticmethod
+    def _column_summary(pass_count: int, fail_count: int, not_available_count: int,
+                        total_rows: int) -> Dict[str, int]:
+        """Build a column summary from its pass/fail/n/a counts and the sheet's row count."""
         # Total only includes valid test results (pass, fail, and n/a all count!)
         valid_total = pass_count + fail_count + not_available_count
         
-        # Debug output - show sample values from each classification
-        print(f"  [DEBUG] Classification counts: {value_types}")
-        if len(sample_values) > 0:
-            print(f"  [DEBUG] Sample values:")
-            for sample in sample_values[:5]:
-                print(f"         {sample}")
-        
         return {
             'pass_count': pass_count,
             'fail_count': fail_count,
             'not_available_count': not_available_count,
-            'invalid_count': invalid_count,
+            # Invalid entries (empty, unrecognized text) - not counted in total
+            'invalid_count': total_rows - valid_total,
             'total': valid_total,
-            'total_rows': len(df)
+            'total_rows': total_rows
         }
     
-    def analyze_all_sheets(self) -> Dict[str, Any]:
-        """Analyze all sheets in the workbook (or only configured sheets if config is provided)."""
+    def _stream_column_counts(self, sheet_name: str, indices: List[int]) -> Tuple[Dict[int, Counter], int]:
+        """Classify the given columns cell by cell from a read-only openpyxl worksheet.
+        
+        Returns the classification counts per column index and the number of data rows,
+        counted as pandas does (header row excluded, trailing empty rows ignored).
+        """
+        counts = {idx: Counter() for idx in indices}
+        total_rows = 0
+        
+        wb = openpyxl.load_workbook(self.excel_path, read_only=True, data_only=True)
+        try:
+            rows = wb[sheet_name].iter_rows(min_row=2, values_only=True)
+            for row_number, row in enumerate(rows, start=1):
+                if any(value is not None and value != '' for value in row):
+                    total_rows = row_number
+                for idx in indices:
+                    value = row[idx] if idx < len(row) else None
+                    if value is not None:
+                        counts[idx][self._classify_value(value)] += 1
+        finally:
+            wb.close()
+        
+        return counts, total_rows
+    
+    def analyze_all_sheets(self, max_workers: int = None) -> Dict[str, Any]:
+        """Analyze all sheets in the workbook (or only configured sheets if config is provided).
+        
+        Args:
+            max_workers: Number of worker processes (defaults to the CPU count, at most
+                         MAX_SHEET_WORKERS; 1 analyzes in-process)
+        """
         print("=" * 70)
         print("QA TESTING RESULTS ANALYSIS")
         print("=" * 70)
@@ -409,9 +542,20 @@ class QAAnalyzer:
         
         print()
         
-        for sheet_name in sheets_to_analyze:
-            result = self.analyze_sheet(sheet_name)
-            self.analysis_results[sheet_name] = result
+        workers = min(max_workers or os.cpu_count() or 1, MAX_SHEET_WORKERS, len(sheets_to_analyze))
+        if workers > 1:
+            # Sheets are independent, so analyze them in parallel; each sheet's output is
+            # buffered in its worker and printed here in the original order
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                outcomes = executor.map(_analyze_sheet_worker, repeat(str(self.excel_path)),
+                                        sheets_to_analyze, repeat(self.sheet_config), repeat(self.stream_mode))
+                for sheet_name, (result, output) in zip(sheets_to_analyze, outcomes):
+                    print(output, end='')
+                    self.analysis_results[sheet_name] = result
+        else:
+            for sheet_name in sheets_to_analyze:
+                result = self.analyze_sheet(sheet_name)
+                self.analysis_results[sheet_name] = result
         
         return self.analysis_results
     
@@ -421,7 +565,7 @@ class QAAnalyzer:
         report_lines.append("=" * 70)
         report_lines.append("QA TESTING SUMMARY REPORT")
         report_lines.append("=" * 70)
-        report_lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        report_lines.append(f"Generated: {self._run_time.strftime('%Y-%m-%d %H:%M:%S')}")
         report_lines.append(f"File: {self.excel_path.name}")
         report_lines.append(f"Total Sheets in Workbook: {len(self.sheet_names)}")
         if self.sheet_config:
@@ -433,18 +577,23 @@ class QAAnalyzer:
         
         # Overall statistics
         sheets_with_results = [s for s in self.analysis_results.values() if s.get('has_results', False)]
-        total_pass = sum(s['summary']['pass_count'] for s in sheets_with_results)
-        total_fail = sum(s['summary']['fail_count'] for s in sheets_with_results)
-        total_not_available = sum(s['summary']['not_available_count'] for s in sheets_with_results)
+        counts = np.array([[s['summary'][key] for key in SUMMARY_COUNT_KEYS[:3]] for s in sheets_with_results],
+                          dtype=int).reshape(-1, 3)
+        total_pass, total_fail, total_not_available = counts.sum(axis=0).tolist()
         total_tests = total_pass + total_fail + total_not_available
         
         report_lines.append("OVERALL SUMMARY")
         report_lines.append("-" * 70)
         report_lines.append(f"Sheets with QA Results: {len(sheets_with_results)}/{len(self.sheet_names)}")
         report_lines.append(f"Total Test Cases: {total_tests}")
-        report_lines.append(f"  ✓ Passed: {total_pass} ({total_pass/total_tests*100:.1f}%)" if total_tests > 0 else "  ✓ Passed: 0")
-        report_lines.append(f"  ✗ Failed: {total_fail} ({total_fail/total_tests*100:.1f}%)" if total_tests > 0 else "  ✗ Failed: 0")
-        report_lines.append(f"  ⊘ Not Available: {total_not_available} ({total_not_available/total_tests*100:.1f}%)" if total_tests > 0 else "  ⊘ Not Available: 0")
+        if total_tests > 0:
+            report_lines.extend([
+                f"  ✓ Passed: {total_pass} ({total_pass / total_tests * 100:.1f}%)",
+                f"  ✗ Failed: {total_fail} ({total_fail / total_tests * 100:.1f}%)",
+                f"  ⊘ Not Available: {total_not_available} ({total_not_available / total_tests * 100:.1f}%)",
+            ])
+        else:
+            report_lines.extend(["  ✓ Passed: 0", "  ✗ Failed: 0", "  ⊘ Not Available: 0"])
         report_lines.append("")
         
         # Per-sheet details
@@ -498,8 +647,7 @@ class QAAnalyzer:
     def save_summary_to_file(self, output_path: str = None) -> str:
         """Save the summary report to a file."""
         if output_path is None:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            output_path = f"qa_summary_{timestamp}.txt"
+            output_path = f"qa_summary_{self._run_ts}.txt"
         
         summary = self.generate_summary_report()
         
@@ -512,126 +660,181 @@ class QAAnalyzer:
     def save_detailed_json(self, output_path: str = None) -> str:
         """Save detailed analysis results to JSON."""
         if output_path is None:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            output_path = f"qa_analysis_{timestamp}.json"
-        
-        # Convert any datetime objects to strings for JSON serialization
-        json_safe_results = self._make_json_serializable(self.analysis_results)
+            output_path = f"qa_analysis_{self._run_ts}.json"
+        
+        # Only column-summary keys can be non-strings (header cells may be dates); every
+        # other datetime is converted by the encoder as the results are written out
+        results = {
+            sheet_name: {**result, 'column_summaries': {self._format_column_name(col): summary
+                                                        for col, summary in result['column_summaries'].items()}}
+            if 'column_summaries' in result else result
+            for sheet_name, result in self.analysis_results.items()
+        }
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(json_safe_results, f, indent=2)
+        if orjson is not None:
+            options = (orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                       | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_SERIALIZE_NUMPY)
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(results, default=_json_default, option=options))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2, cls=_SafeEncoder)
         
         print(f"✓ Detailed analysis saved to: {output_path}")
         return output_path
     
-    def _make_json_serializable(self, obj: Any) -> Any:
-        """Convert objects to JSON-serializable format, including datetime keys."""
-        if isinstance(obj, dict):
-            # Convert both keys and values - keys might be datetime objects too
-            new_dict = {}
-            for k, v in obj.items():
-                # Convert key if it's a datetime
-                if isinstance(k, (pd.Timestamp, datetime)):
-                    new_key = k.strftime('%Y-%m-%d %H:%M:%S')
-                elif pd.isna(k):
-                    new_key = 'null'
-                else:
-                    new_key = str(k)  # Ensure all keys are strings
-                new_dict[new_key] = self._make_json_serializable(v)
-            return new_dict
-        elif isinstance(obj, list):
-            return [self._make_json_serializable(item) for item in obj]
-        elif isinstance(obj, (pd.Timestamp, datetime)):
-            return obj.strftime('%Y-%m-%d %H:%M:%S')
-        elif pd.isna(obj):
-            return None
-        else:
-            return obj
+    @staticmethod
+    def _format_column_name(column: Any) -> str:
+        """Format a result column name for CSV output (header cells can be dates)."""
+        if isinstance(column, (pd.Timestamp, datetime)):
+            return column.strftime('%Y-%m-%d %H:%M:%S')
+        return str(column)
     
     def save_to_csv(self, output_path: str = None) -> str:
         """Save analysis results to CSV format for easy tracking over time."""
         if output_path is None:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            output_path = f"qa_results_{timestamp}.csv"
-        
-        # Prepare data for CSV
-        csv_data = []
-        run_timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        
-        for sheet_name, result in self.analysis_results.items():
-            row = {
-                'timestamp': run_timestamp,
-                'sheet_name': sheet_name,
-                'total_rows': result.get('total_rows', 0),
-                'total_columns': result.get('total_columns', 0),
-                'has_results': result.get('has_results', False),
-            }
-            
-            if result.get('has_results', False):
-                summary = result['summary']
-                total_tests = summary['total']
-                pass_count = summary['pass_count']
-                fail_count = summary['fail_count']
-                not_available_count = summary['not_available_count']
-                
-                # Convert result columns to strings (they might be datetime objects)
-                result_columns = result.get('result_columns', [])
-                result_columns_str = []
-                for col in result_columns:
-                    if isinstance(col, (pd.Timestamp, datetime)):
-                        result_columns_str.append(col.strftime('%Y-%m-%d %H:%M:%S'))
-                    else:
-                        result_columns_str.append(str(col))
-                
-                # Same for primary column
-                primary_col = result.get('primary_column', '')
-                if isinstance(primary_col, (pd.Timestamp, datetime)):
-                    primary_col = primary_col.strftime('%Y-%m-%d %H:%M:%S')
-                else:
-                    primary_col = str(primary_col)
-                
-                row.update({
-                    'pass_count': pass_count,
-                    'fail_count': fail_count,
-                    'not_available_count': not_available_count,
-                    'invalid_count': summary.get('invalid_count', 0),
-                    'total_tests': total_tests,
-                    'total_rows_in_sheet': summary.get('total_rows', total_tests),
-                    'pass_percentage': round(pass_count / total_tests * 100, 2) if total_tests > 0 else 0,
-                    'fail_percentage': round(fail_count / total_tests * 100, 2) if total_tests > 0 else 0,
-                    'not_available_percentage': round(not_available_count / total_tests * 100, 2) if total_tests > 0 else 0,
-                    'configured_column_letter': result.get('configured_column_letter', ''),
-                    'primary_result_column': primary_col,
-                    'all_result_columns': '|'.join(result_columns_str),
-                    'status': 'analyzed'
-                })
-            else:
-                row.update({
-                    'pass_count': 0,
-                    'fail_count': 0,
-                    'not_available_count': 0,
-                    'invalid_count': 0,
-                    'total_tests': 0,
-                    'total_rows_in_sheet': result.get('total_rows', 0),
-                    'pass_percentage': 0,
-                    'fail_percentage': 0,
-                    'not_available_percentage': 0,
-                    'configured_column_letter': result.get('configured_column_letter', ''),
-                    'primary_result_column': '',
-                    'all_result_columns': '',
-                    'status': 'no_results' if 'error' not in result else 'error'
-                })
-            
-            csv_data.append(row)
+            output_path = f"qa_results_{self._run_ts}.csv"
+        
+        # Build the frame column by column; sheets without results get zero counts
+        run_timestamp = self._run_time.strftime('%Y-%m-%d %H:%M:%S')
+        results = list(self.analysis_results.values())
+        analyzed = [result.get('has_results', False) for result in results]
+        summaries = [result['summary'] if has_results else {} for result, has_results in zip(results, analyzed)]
+        
+        df = pd.DataFrame({
+            'timestamp': [run_timestamp] * len(results),
+            'sheet_name': list(self.analysis_results.keys()),
+            'total_rows': [result.get('total_rows', 0) for result in results],
+            'total_columns': [result.get('total_columns', 0) for result in results],
+            'has_results': analyzed,
+            'pass_count': [summary.get('pass_count', 0) for summary in summaries],
+            'fail_count': [summary.get('fail_count', 0) for summary in summaries],
+            'not_available_count': [summary.get('not_available_count', 0) for summary in summaries],
+            'invalid_count': [summary.get('invalid_count', 0) for summary in summaries],
+            'total_tests': [summary.get('total', 0) for summary in summaries],
+            'total_rows_in_sheet': [summary.get('total_rows', summary['total']) if summary else result.get('total_rows', 0)
+                                    for result, summary in zip(results, summaries)],
+        })
+        
+        # Percentages for every sheet at once; sheets without valid tests stay at 0
+        total_tests = df['total_tests']
+        for count_column, percentage_column in [('pass_count', 'pass_percentage'),
+                                                ('fail_count', 'fail_percentage'),
+                                                ('not_available_count', 'not_available_percentage')]:
+            df[percentage_column] = (df[count_column] / total_tests * 100).round(2).where(total_tests > 0, 0)
+        
+        # Result column names might be datetime objects, so format them as strings
+        df['configured_column_letter'] = [result.get('configured_column_letter', '') for result in results]
+        df['primary_result_column'] = [self._format_column_name(result.get('primary_column', '')) if has_results else ''
+                                       for result, has_results in zip(results, analyzed)]
+        df['all_result_columns'] = ['|'.join(map(self._format_column_name, result.get('result_columns', []))) if has_results else ''
+                                    for result, has_results in zip(results, analyzed)]
+        df['status'] = ['analyzed' if has_results else 'no_results' if 'error' not in result else 'error'
+                        for result, has_results in zip(results, analyzed)]
         
         # Write to CSV
-        df = pd.DataFrame(csv_data)
         df.to_csv(output_path, index=False)
         
         print(f"✓ CSV results saved to: {output_path}")
         return output_path
 
 
+def _alternation(patterns: List[str], flags: int = re.IGNORECASE) -> 're.Pattern':
+    """Compile a list of patterns into one alternation (case-insensitive by default).
+    
+    Groups are made non-capturing so the result can be used with Series.str.contains.
+    """
+    non_capturing = [re.sub(r'(?<!\\)\((?!\?)', '(?:', p) for p in patterns]
+    return re.compile('|'.join(f'(?:{p})' for p in non_capturing), flags)
+
+
+# Patterns compiled once at import; each group is a single alternation so a
+# cell needs one search per group instead of one per pattern
+_PASS_RE = _alternation(QAAnalyzer.PASS_PATTERNS)
+_FAIL_RE = _alternation(QAAnalyzer.FAIL_PATTERNS)
+_NA_RE = _alternation(QAAnalyzer.NOT_AVAILABLE_PATTERNS, flags=0)
+_NA_VALUES = ['n/a', 'na', 'n-a', 'n a', 'not available', 'not applicable']
+_WS_RE = re.compile(r'\s+')
+
+# Every category in one alternation: most free-text cells match none of them,
+# so a single search settles them as invalid
+_ANY_RE = re.compile(
+    rf'(?P<not_available>{_NA_RE.pattern})'
+    rf'|(?P<pass>(?i:{_PASS_RE.pattern}))'
+    rf'|(?P<fail>(?i:{_FAIL_RE.pattern}))'
+)
+
+
+def _classify_normalized(value_lower: str) -> str:
+    """Classify a whitespace-normalised, lowercased cell value with the regex patterns."""
+    match = _ANY_RE.search(value_lower)
+    
+    # Anything else is invalid (not counted in analysis)
+    if match is None:
+        return 'invalid'
+    
+    # The leftmost match isn't necessarily the winner: n/a beats pass/fail and pass beats
+    # fail wherever they appear. Nothing matches before match.start(), so only the rest
+    # of the value needs checking for a higher-precedence category.
+    # Now that we use keep_default_na=False, "n/a" will come as the string "n/a"
+    category = match.lastgroup
+    if category == 'not_available' or _NA_RE.search(value_lower, match.start()):
+        return 'not_available'
+    
+    if category == 'pass' or _PASS_RE.search(value_lower, match.start()):
+        return 'pass'
+    
+    return 'fail'
+
+
+# Short canonical tokens make up most result cells. Their categories are derived
+# from the patterns above, so the lookup can never disagree with the regex path.
+_FAST_MAP = {token: _classify_normalized(token) for token in [
+    *_NA_VALUES,
+    'pass', 'passed', 'ok', 'success', 'successful', 'accept', 'accepted',
+    'approve', 'approved', 'complete', 'completed', 'valid', '✓', '✔',
+    'fail', 'failed', 'failure', 'error', 'reject', 'rejected', 'block', 'blocked',
+    'invalid', 'incomplete', 'pending', 'in progress', 'todo', 'to do',
+    'not started', 'not done', 'not completed', '✗', '✘',
+]}
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert the values orjson can't encode itself (dates, pandas missing values)."""
+    if isinstance(obj, (pd.Timestamp, datetime)):
+        return obj.strftime('%Y-%m-%d %H:%M:%S')
+    if pd.isna(obj):
+        return None
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class _SafeEncoder(json.JSONEncoder):
+    """JSON encoder that converts dates and pandas missing values as it writes."""
+    
+    def default(self, obj: Any) -> Any:
+        return _json_default(obj)
+
+
+# Analyzers cached per worker process, so each worker opens the workbook only once
+_worker_analyzers = {}
+
+
+def _analyze_sheet_worker(excel_path: str, sheet_name: str, sheet_config: Dict[str, List[str]],
+                          stream_mode: bool = False) -> Tuple[Dict[str, Any], str]:
+    """Analyze one sheet in a worker process, returning the result and its printed output."""
+    analyzer = _worker_analyzers.get(excel_path)
+    if analyzer is None:
+        analyzer = QAAnalyzer(excel_path)
+        _worker_analyzers[excel_path] = analyzer
+    analyzer.sheet_config = sheet_config
+    analyzer.stream_mode = stream_mode
+    
+    output = io.StringIO()
+    with redirect_stdout(output):
+        result = analyzer.analyze_sheet(sheet_name)
+    return result, output.getvalue()
+
+
 def main():
     """Main function to run the QA analyzer."""
     import sys
@@ -642,15 +845,14 @@ def main():
     else:
         excel_path = "data/Testing master_Welcome Call 2026.xlsx"
     
-    # Create analyzer with QA team's sheet configuration
-    analyzer = QAAnalyzer(excel_path, sheet_config=QA_SHEET_CONFIG)
-    
-    # Load workbook
-    if not analyzer.load_workbook():
-        return
-    
-    # Analyze configured sheets
-    analyzer.analyze_all_sheets()
+    # Create analyzer with QA team's sheet configuration; the workbook is closed once all sheets are read
+    with QAAnalyzer(excel_path, sheet_config=QA_SHEET_CONFIG) as analyzer:
+        # Load workbook
+        if not analyzer.load_workbook():
+            return
+        
+        # Analyze configured sheets
+        analyzer.analyze_all_sheets()
     
     # Generate and print summary
     summary = analyzer.generate_summary_report()
@@ -5,23 +5,20 @@ Even simpler approach - just get the code from URL
 
 import os
 import sys
-import pickle
 from urllib.parse import urlparse, parse_qs
 
+from token_store import google_libs_available, TOKEN_PATH, token_exists, load_credentials, save_credentials, remove_token
+
+# This script only talks to Google, so stop here with the install command if the libraries are missing
+if not google_libs_available():
+    sys.exit(1)
+
+from google_auth_oauthlib.flow import InstalledAppFlow
+from google.auth.transport.requests import Request
+
 
 def simple_authenticate():
     """Simple authentication process."""
-    try:
-        from google.oauth2.credentials import Credentials
-        from google_auth_oauthlib.flow import InstalledAppFlow
-        from google.auth.transport.requests import Request
-    except ImportError:
-        print("Installing required packages...")
-        os.system("pip install -q google-auth-oauthlib google-auth-httplib2 google-api-python-client")
-        from google.oauth2.credentials import Credentials
-        from google_auth_oauthlib.flow import InstalledAppFlow
-        from google.auth.transport.requests import Request
-    
     SCOPES = [
         'https://www.googleapis.com/auth/drive.readonly',
         'https://www.googleapis.com/auth/drive.file'
@@ -39,11 +36,10 @@ def simple_authenticate():
         return False
     
     # Check existing token
-    if os.path.exists('token.pickle'):
+    if token_exists():
         print("Found existing authentication token...")
         try:
-            with open('token.pickle', 'rb') as token:
-                creds = pickle.load(token)
+            creds = load_credentials(SCOPES)
             
             if creds and creds.valid:
                 print("✅ Already authenticated!\n")
@@ -51,13 +47,12 @@ def simple_authenticate():
             elif creds and creds.expired and creds.refresh_token:
                 print("Refreshing token...")
                 creds.refresh(Request())
-                with open('token.pickle', 'wb') as token:
-                    pickle.dump(creds, token)
+                save_credentials(creds)
                 print("✅ Token refreshed!\n")
                 return True
         except:
             print("Token invalid, will re-authenticate...\n")
-            os.remove('token.pickle')
+            remove_token()
     
     # Start authentication
     print("📋 INSTRUCTIONS FOR WSL:")
@@ -113,13 +108,12 @@ def simple_authenticate():
                 creds = flow.credentials
                 
                 # Save credentials
-                with open('token.pickle', 'wb') as token:
-                    pickle.dump(creds, token)
+                save_credentials(creds)
                 
                 print("\n" + "=" * 70)
                 print("✅ AUTHENTICATION SUCCESSFUL!")
                 print("=" * 70)
-                print("\nToken saved to: token.pickle")
+                print(f"\nToken saved to: {TOKEN_PATH}")
                 print("\nYou can now:")
                 print("  • Download: python download_from_gdrive.py")
                 print("  • Upload: ./upload.sh")
@@ -0,0 +1,116 @@
+"""
+Google Drive Token Storage
+Loads and saves OAuth credentials as JSON, migrating legacy token.pickle files.
+"""
+
+import hashlib
+import importlib.util
+import json
+import os
+import pickle
+
+
+TOKEN_PATH = 'token.json'
+LEGACY_TOKEN_PATH = 'token.pickle'
+ACCOUNT_CACHE_PATH = 'token_meta.json'
+
+GOOGLE_PACKAGES = ['google-auth-oauthlib', 'google-auth-httplib2', 'google-api-python-client']
+GOOGLE_MODULES = ['googleapiclient', 'google_auth_oauthlib', 'google_auth_httplib2']
+
+
+def print_google_install_hint() -> None:
+    """Tell the user how to install the missing Google API client libraries."""
+    print("❌ Google API libraries not installed.")
+    print(f"Install with: pip install {' '.join(GOOGLE_PACKAGES)}")
+
+
+def google_libs_available() -> bool:
+    """Check for the Google API client libraries, printing the install command if any are missing."""
+    if all(importlib.util.find_spec(module) for module in GOOGLE_MODULES):
+        return True
+    print_google_install_hint()
+    return False
+
+
+def token_exists() -> bool:
+    """Check whether a saved token (JSON or legacy pickle) is present."""
+    return os.path.exists(TOKEN_PATH) or os.path.exists(LEGACY_TOKEN_PATH)
+
+
+def load_credentials(scopes: list):
+    """
+    Load saved credentials, or None if no token has been saved yet.
+
+    A legacy token.pickle is converted to token.json the first time it is read.
+
+    Args:
+        scopes: OAuth scopes the credentials are used with
+
+    Returns:
+        google.oauth2.credentials.Credentials or None
+    """
+    from google.oauth2.credentials import Credentials
+
+    if os.path.exists(TOKEN_PATH):
+        with open(TOKEN_PATH, 'r', encoding='utf-8') as token:
+            return Credentials.from_authorized_user_info(json.load(token), scopes)
+
+    if os.path.exists(LEGACY_TOKEN_PATH):
+        with open(LEGACY_TOKEN_PATH, 'rb') as token:
+            creds = pickle.load(token)
+        save_credentials(creds)
+        os.remove(LEGACY_TOKEN_PATH)
+        return creds
+
+    return None
+
+
+def save_credentials(creds) -> None:
+    """Save credentials to token.json."""
+    with open(TOKEN_PATH, 'w', encoding='utf-8') as token:
+        token.write(creds.to_json())
+
+
+def _credentials_key(creds) -> str:
+    """Short hash identifying the grant behind a set of credentials."""
+    # The refresh token survives access-token refreshes, so prefer it as the key
+    secret = creds.refresh_token or creds.token or ''
+    return hashlib.sha256(secret.encode()).hexdigest()[:16]
+
+
+def load_account_info(creds):
+    """
+    Return the cached Drive account info for these credentials, or None on a miss.
+
+    Returns:
+        Dict with 'emailAddress' and 'displayName', or None
+    """
+    try:
+        with open(ACCOUNT_CACHE_PATH, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if cached.get('key') != _credentials_key(creds):
+        return None
+    return cached.get('user')
+
+
+def save_account_info(creds, user: dict) -> None:
+    """Cache the Drive account info for these credentials."""
+    cached = {
+        'key': _credentials_key(creds),
+        'user': {
+            'emailAddress': user.get('emailAddress', 'Unknown'),
+            'displayName': user.get('displayName', ''),
+        }
+    }
+    with open(ACCOUNT_CACHE_PATH, 'w', encoding='utf-8') as f:
+        json.dump(cached, f)
+
+
+def remove_token() -> None:
+    """Delete any saved token so the next run re-authenticates."""
+    for path in (TOKEN_PATH, LEGACY_TOKEN_PATH, ACCOUNT_CACHE_PATH):
+        if os.path.exists(path):
+            os.remove(path)
@@ -3,10 +3,292 @@ Google Drive Uploader
 Uploads reports and visualizations to Google Drive.
 """
 
+import json
+import mimetypes
+import mmap
 import os
 import sys
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+
+from token_store import load_credentials, print_google_install_hint, save_credentials
+
+try:
+    from google_auth_oauthlib.flow import InstalledAppFlow
+    from google.auth.transport.requests import AuthorizedSession, Request
+    from googleapiclient.discovery import build
+    from googleapiclient.errors import HttpError
+    from googleapiclient.http import MediaFileUpload
+    from requests.adapters import HTTPAdapter
+    _GOOGLE_AVAILABLE = True
+except ImportError:
+    _GOOGLE_AVAILABLE = False
+
+
+# Concurrent uploads; kept low to stay under the Drive per-user write rate limit
+UPLOAD_WORKERS = 4
+
+# Files up to this size go up in one multipart request; larger ones use a resumable session
+SIMPLE_UPLOAD_LIMIT = 5 * 1024 * 1024
+
+# Larger chunks mean fewer round-trips per resumable upload
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Multipart upload endpoint, used directly over a keep-alive AuthorizedSession
+MULTIPART_UPLOAD_URL = ('https://www.googleapis.com/upload/drive/v3/files'
+                        '?uploadType=multipart&fields=id,webViewLink')
+
+# (prefix, suffix) of the timestamped reports; the newest of each kind is uploaded
+REPORT_PATTERNS = [('qa_summary_', '.txt'), ('qa_results_', '.csv')]
+
+# Resumable session URIs of unfinished large uploads, so an interrupted upload continues
+# from the last acknowledged byte on the next run
+RESUME_STATE_PATH = '.gdrive_resume.json'
+
+# Refresh access tokens this long before they expire, so no upload starts with a dying token
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+
+SCOPES = [
+    'https://www.googleapis.com/auth/drive.readonly',
+    'https://www.googleapis.com/auth/drive.file'
+]
+
+# Credentials per credentials.json path, and Drive services per thread, reused across uploads
+_CREDENTIALS_CACHE = {}
+_thread_local = threading.local()
+
+# Uploads run on several threads, but share one resume state file
+_resume_lock = threading.Lock()
+
+
+def _expires_soon(creds) -> bool:
+    """Check whether the access token expires within TOKEN_REFRESH_MARGIN."""
+    if creds.expiry is None:
+        return False
+    # google-auth keeps expiry as a naive UTC datetime
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return creds.expiry - now < TOKEN_REFRESH_MARGIN
+
+
+def get_credentials(credentials_path: str = "credentials.json"):
+    """
+    Load saved credentials, refreshing or re-authenticating as needed.
+    
+    Args:
+        credentials_path: Path to Google API credentials JSON
+    
+    Returns:
+        google.oauth2.credentials.Credentials, or None if the libraries or credentials file are missing
+    """
+    if not _GOOGLE_AVAILABLE:
+        print_google_install_hint()
+        return None
+    
+    creds = _CREDENTIALS_CACHE.get(credentials_path)
+    if creds is None:
+        # Load existing credentials
+        creds = load_credentials(SCOPES)
+    
+    # Refresh a token that is about to expire, as well as one that already has
+    if creds and creds.refresh_token and (not creds.valid or _expires_soon(creds)):
+        creds.refresh(Request())
+        save_credentials(creds)
+    
+    # If no valid credentials, authenticate
+    if not creds or not creds.valid:
+        if not os.path.exists(credentials_path):
+            print(f"❌ Credentials file not found: {credentials_path}")
+            print("\nTo upload to Google Drive, you need to:")
+            print("1. Go to https://console.cloud.google.com/")
+            print("2. Create a project and enable Google Drive API")
+            print("3. Create OAuth 2.0 credentials (Desktop app)")
+            print("4. Download credentials.json to this directory")
+            print("\nSee GDRIVE_SETUP.md for detailed instructions.")
+            return None
+        
+        flow = InstalledAppFlow.from_client_secrets_file(credentials_path, SCOPES)
+        creds = flow.run_local_server(port=0)
+        
+        # Save credentials for next time
+        save_credentials(creds)
+    
+    _CREDENTIALS_CACHE[credentials_path] = creds
+    return creds
+
+
+def _get_service(creds):
+    """
+    Return this thread's Drive v3 service, building it on first use.
+    
+    Each thread needs its own service, as httplib2 is not thread-safe; the bundled
+    (static) discovery document means building one makes no HTTP request.
+    """
+    service = getattr(_thread_local, 'service', None)
+    if service is None or _thread_local.creds is not creds:
+        service = build('drive', 'v3', credentials=creds, static_discovery=True, cache_discovery=False)
+        _thread_local.service, _thread_local.creds = service, creds
+    return service
+
+
+def _get_session(creds) -> 'AuthorizedSession':
+    """
+    Return this thread's AuthorizedSession, creating it on first use.
+    
+    The session keeps its HTTPS connection alive, so every upload after the first on
+    a thread skips the TCP and TLS handshakes.
+    """
+    session = getattr(_thread_local, 'session', None)
+    if session is None or session.credentials is not creds:
+        session = AuthorizedSession(creds)
+        session.mount('https://', HTTPAdapter(max_retries=3))
+        _thread_local.session = session
+    return session
+
+
+def _upload_multipart(session: 'AuthorizedSession', file_path: str, file_metadata: dict) -> dict:
+    """Upload metadata and content together in one multipart/related POST."""
+    mimetype = mimetypes.guess_type(file_path)[0] or 'application/octet-stream'
+    boundary = uuid.uuid4().hex
+    
+    with open(file_path, 'rb') as f:
+        # Join straight from a memory map of the file, so the content is copied once
+        # (page cache -> request body) instead of first being read into its own bytes
+        size = os.fstat(f.fileno()).st_size
+        content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        try:
+            body = b''.join([
+                f'--{boundary}\r\nContent-Type: application/json; charset=UTF-8\r\n\r\n'.encode(),
+                json.dumps(file_metadata).encode(),
+                f'\r\n--{boundary}\r\nContent-Type: {mimetype}\r\n\r\n'.encode(),
+                content,
+                f'\r\n--{boundary}--'.encode(),
+            ])
+        finally:
+            if size:
+                content.close()
+    
+    response = session.post(MULTIPART_UPLOAD_URL, data=body,
+                            headers={'Content-Type': f'multipart/related; boundary={boundary}'})
+    response.raise_for_status()
+    return response.json()
+
+
+def _upload_one(creds, file_path: str, folder_id: str = None, stat: os.stat_result = None) -> dict:
+    """
+    Upload a single file with already-loaded credentials.
+    
+    Args:
+        stat: The file's os.stat() result, if the caller already has it
+    
+    Returns:
+        The created file's metadata ('id' and 'webViewLink')
+    """
+    file_metadata = {
+        'name': os.path.basename(file_path)
+    }
+    
+    if folder_id:
+        file_metadata['parents'] = [folder_id]
+    
+    # Reports are usually small: a single multipart POST beats initiating a resumable session
+    if stat is None:
+        stat = os.stat(file_path)
+    if stat.st_size <= SIMPLE_UPLOAD_LIMIT:
+        return _upload_multipart(_get_session(creds), file_path, file_metadata)
+    
+    return _upload_resumable(_get_service(creds), file_path, file_metadata, stat)
+
+
+def _load_resume_state() -> dict:
+    """Load the saved resumable-upload sessions, keyed by absolute file path."""
+    try:
+        with open(RESUME_STATE_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _is_resumable(path: str, saved: dict) -> bool:
+    """Check that a saved session still matches the file's size and modification time."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return False
+    return saved.get('size') == stat.st_size and saved.get('mtime_ns') == stat.st_mtime_ns
+
+
+def _save_resume_entry(key: str, entry: dict = None) -> None:
+    """
+    Save one file's upload session, or clear it when entry is None.
+    
+    Clearing also drops sessions for files that were removed or changed since, so the
+    state file is deleted once no upload is left to resume.
+    """
+    with _resume_lock:
+        state = _load_resume_state()
+        if entry is not None:
+            state[key] = entry
+        else:
+            state.pop(key, None)
+            state = {path: saved for path, saved in state.items() if _is_resumable(path, saved)}
+        
+        if state:
+            with open(RESUME_STATE_PATH, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+        elif os.path.exists(RESUME_STATE_PATH):
+            os.remove(RESUME_STATE_PATH)
+
+
+def _upload_resumable(service, file_path: str, file_metadata: dict, stat: os.stat_result,
+                      resume: bool = True) -> dict:
+    """
+    Upload a large file chunk by chunk, checkpointing the session after every chunk.
+    
+    A checkpoint is only reused for the same file, size and modification time; a
+    session that has expired on the Drive side is dropped and the upload restarted.
+    """
+    key = os.path.abspath(file_path)
+    fingerprint = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+    
+    media = MediaFileUpload(file_path, resumable=True, chunksize=UPLOAD_CHUNK_SIZE)
+    request = service.files().create(
+        body=file_metadata,
+        media_body=media,
+        fields='id, webViewLink'
+    )
+    
+    saved = _load_resume_state().get(key) if resume else None
+    resumed = saved is not None and all(saved.get(k) == v for k, v in fingerprint.items())
+    if resumed:
+        request.resumable_uri = saved['uri']
+        request.resumable_progress = saved['progress']
+    
+    response = None
+    try:
+        while response is None:
+            status, response = request.next_chunk()
+            if status:
+                _save_resume_entry(key, {**fingerprint, 'uri': request.resumable_uri,
+                                         'progress': status.resumable_progress})
+    except HttpError:
+        if resumed:
+            # The saved session is no longer valid; start a fresh one
+            _save_resume_entry(key, None)
+            return _upload_resumable(service, file_path, file_metadata, stat, resume=False)
+        raise
+    
+    _save_resume_entry(key, None)
+    return response
+
+
+def _print_uploaded(file: dict) -> None:
+    """Print the details of an uploaded file."""
+    print(f"✅ Uploaded successfully!")
+    print(f"   File ID: {file.get('id')}")
+    print(f"   View at: {file.get('webViewLink')}")
 
 
 def upload_with_google_api(file_path: str, folder_id: str = None, credentials_path: str = "credentials.json") -> bool:
@@ -22,80 +304,14 @@ def upload_with_google_api(file_path: str, folder_id: str = None, credentials_pa
         True if successful, False otherwise
     """
     try:
-        from google.oauth2.credentials import Credentials
-        from google_auth_oauthlib.flow import InstalledAppFlow
-        from google.auth.transport.requests import Request
-        from googleapiclient.discovery import build
-        from googleapiclient.http import MediaFileUpload
-        import pickle
-    except ImportError:
-        print("❌ Google API libraries not installed.")
-        print("Installing: google-auth-oauthlib google-auth-httplib2 google-api-python-client")
-        os.system("pip install google-auth-oauthlib google-auth-httplib2 google-api-python-client")
-        from google.oauth2.credentials import Credentials
-        from google_auth_oauthlib.flow import InstalledAppFlow
-        from google.auth.transport.requests import Request
-        from googleapiclient.discovery import build
-        from googleapiclient.http import MediaFileUpload
-        import pickle
-    
-    SCOPES = [
-        'https://www.googleapis.com/auth/drive.readonly',
-        'https://www.googleapis.com/auth/drive.file'
-    ]
-    
-    try:
-        creds = None
-        token_path = 'token.pickle'
-        
-        # Load existing credentials
-        if os.path.exists(token_path):
-            with open(token_path, 'rb') as token:
-                creds = pickle.load(token)
-        
-        # If no valid credentials, authenticate
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                creds.refresh(Request())
-            else:
-                if not os.path.exists(credentials_path):
-                    print(f"❌ Credentials file not found: {credentials_path}")
-                    print("\nTo upload to Google Drive, you need to:")
-                    print("1. Go to https://console.cloud.google.com/")
-                    print("2. Create a project and enable Google Drive API")
-                    print("3. Create OAuth 2.0 credentials (Desktop app)")
-                    print("4. Download credentials.json to this directory")
-                    print("\nSee GDRIVE_SETUP.md for detailed instructions.")
-                    return False
-                
-                flow = InstalledAppFlow.from_client_secrets_file(credentials_path, SCOPES)
-                creds = flow.run_local_server(port=0)
-            
-            # Save credentials for next time
-            with open(token_path, 'wb') as token:
-                pickle.dump(creds, token)
+        creds = get_credentials(credentials_path)
+        if creds is None:
+            return False
         
         # Upload the file
         print(f"📤 Uploading to Google Drive: {file_path}")
-        service = build('drive', 'v3', credentials=creds)
-        
-        file_metadata = {
-            'name': os.path.basename(file_path)
-        }
-        
-        if folder_id:
-            file_metadata['parents'] = [folder_id]
-        
-        media = MediaFileUpload(file_path, resumable=True)
-        file = service.files().create(
-            body=file_metadata,
-            media_body=media,
-            fields='id, webViewLink'
-        ).execute()
-        
-        print(f"✅ Uploaded successfully!")
-        print(f"   File ID: {file.get('id')}")
-        print(f"   View at: {file.get('webViewLink')}")
+        file = _upload_one(creds, file_path, folder_id)
+        _print_uploaded(file)
         
         return True
         
@@ -104,6 +320,85 @@ def upload_with_google_api(file_path: str, folder_id: str = None, credentials_pa
         return False
 
 
+def upload_files(file_paths: list, folder_id: str = None, credentials_path: str = "credentials.json") -> int:
+    """
+    Upload several files concurrently, authenticating only once.
+    
+    Each upload is latency-bound, so running them side by side takes about as long
+    as the slowest one. Missing files are reported up front; results are printed in
+    the order the files were given.
+    
+    Args:
+        file_paths: Local files to upload
+        folder_id: Google Drive folder ID (optional)
+        credentials_path: Path to Google API credentials JSON
+    
+    Returns:
+        Number of files uploaded successfully
+    """
+    # One stat per file serves as both the existence check and the upload size
+    uploads = []
+    for file_path in file_paths:
+        try:
+            uploads.append((file_path, os.stat(file_path)))
+        except FileNotFoundError:
+            print(f"❌ File not found: {file_path}")
+    
+    if not uploads:
+        return 0
+    try:
+        creds = get_credentials(credentials_path)
+    except Exception as e:
+        print(f"❌ Error uploading to Google Drive: {e}")
+        return 0
+    if creds is None:
+        return 0
+    
+    def upload(file_path, stat):
+        try:
+            return _upload_one(creds, file_path, folder_id, stat), None
+        except Exception as e:
+            return None, e
+    
+    # Announce every upload before starting, since results only arrive once each one finishes
+    for file_path, _ in uploads:
+        print(f"📤 Uploading to Google Drive: {file_path}")
+    print()
+    
+    success_count = 0
+    with ThreadPoolExecutor(max_workers=min(UPLOAD_WORKERS, len(uploads))) as executor:
+        for (file_path, _), (file, error) in zip(uploads, executor.map(upload, *zip(*uploads))):
+            print(f"📄 {file_path}")
+            if error is None:
+                _print_uploaded(file)
+                success_count += 1
+            else:
+                print(f"❌ Error uploading to Google Drive: {error}")
+            print()
+    
+    return success_count
+
+
+def _find_latest_reports(patterns: list) -> list:
+    """
+    Find the newest file for each (prefix, suffix) pattern in one scan of the current directory.
+    
+    Report names end in a sortable timestamp, so the newest file is the one with the
+    greatest name.
+    
+    Returns:
+        One file name per pattern, or None where nothing matched
+    """
+    latest = [None] * len(patterns)
+    with os.scandir('.') as entries:
+        for entry in entries:
+            name = entry.name
+            for i, (prefix, suffix) in enumerate(patterns):
+                if name.startswith(prefix) and name.endswith(suffix) and (latest[i] is None or name > latest[i]):
+                    latest[i] = name
+    return latest
+
+
 def upload_latest_reports(credentials_path: str = "credentials.json", folder_id: str = None):
     """Upload the latest reports to Google Drive."""
     print("=" * 70)
@@ -111,20 +406,8 @@ def upload_latest_reports(credentials_path: str = "credentials.json", folder_id:
     print("=" * 70)
     print()
     
-    # Find latest files
-    import glob
-    
-    files_to_upload = []
-    
-    # Latest summary
-    summaries = sorted(glob.glob("qa_summary_*.txt"), reverse=True)
-    if summaries:
-        files_to_upload.append(summaries[0])
-    
-    # Latest CSV
-    csvs = sorted(glob.glob("qa_results_*.csv"), reverse=True)
-    if csvs:
-        files_to_upload.append(csvs[0])
+    # Latest summary and CSV
+    files_to_upload = [f for f in _find_latest_reports(REPORT_PATTERNS) if f]
     
     # HTML report
     html_report = "visualizations/visualizations_report.html"
@@ -141,12 +424,8 @@ def upload_latest_reports(credentials_path: str = "credentials.json", folder_id:
         print(f"  • {f}")
     print()
     
-    # Upload each file
-    success_count = 0
-    for file_path in files_to_upload:
-        if upload_with_google_api(file_path, folder_id, credentials_path):
-            success_count += 1
-        print()
+    # Upload the files side by side
+    success_count = upload_files(files_to_upload, folder_id, credentials_path)
     
     print("=" * 70)
     if success_count == len(files_to_upload):
@@ -170,14 +449,8 @@ def main():
     args = parser.parse_args()
     
     if args.files:
-        # Upload specific files
-        success_count = 0
-        for file_path in args.files:
-            if os.path.exists(file_path):
-                if upload_with_google_api(file_path, args.folder_id, args.credentials):
-                    success_count += 1
-            else:
-                print(f"❌ File not found: {file_path}")
+        # Upload specific files (missing ones are reported by upload_files)
+        success_count = upload_files(args.files, args.folder_id, args.credentials)
         
         print(f"\n✅ Uploaded {success_count}/{len(args.files)} files")
     else:
@@ -3,17 +3,202 @@ QA Progress Visualizer
 Creates charts and graphs to visualize testing progress over time.
 """
 
+import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # charts are only written to files; workers must not need a display
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
-import seaborn as sns
+from matplotlib.transforms import offset_copy
 import glob
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict
 import sys
 import os
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+
+# Timestamp format written by qa_analyzer.save_to_csv
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Text columns, read as strings even when one file's values all look numeric
+TEXT_COLUMNS = ['sheet_name', 'configured_column_letter', 'primary_result_column',
+                'all_result_columns', 'status']
+
+# Per-sheet test counts, summed per run by the charts
+COUNT_COLUMNS = ['pass_count', 'fail_count', 'not_available_count', 'invalid_count', 'total_tests']
+
+# Two-line run label used on chart axes
+RUN_LABEL_FORMAT = '%Y-%m-%d\n%H:%M'
+
+# Parquet copy of the combined CSV data (in the output directory), so reruns only parse new CSVs
+SNAPSHOT_NAME = 'combined.parquet'
+
+# Schema metadata key listing the CSV files (with mtime and size) a snapshot was built from
+SNAPSHOT_SOURCES_KEY = b'qa_sources'
+
+# Records which inputs the current charts and report were rendered from, so unchanged reruns can skip rendering
+RENDER_KEY_NAME = '.render_key.json'
+
+# Default PNG resolution; charts are viewed on screen in the HTML report.
+# Override with the QA_VIZ_DPI environment variable for print-quality output.
+DEFAULT_DPI = 110
+
+# Seaborn module, imported by _seaborn() when the first chart is drawn
+_sns = None
+
+# Static start of the HTML report (doctype, styles, page title), pre-encoded since it never changes
+HTML_REPORT_HEAD = b"""
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>QA Testing Progress Visualizations</title>
+    <style>
+        body {
+            font-family: Arial, sans-serif;
+            max-width: 1400px;
+            margin: 0 auto;
+            padding: 20px;
+            background-color: #f5f5f5;
+        }
+        h1 {
+            color: #2c3e50;
+            text-align: center;
+            border-bottom: 3px solid #3498db;
+            padding-bottom: 10px;
+        }
+        .info {
+            background-color: #e8f4f8;
+            border-left: 4px solid #3498db;
+            padding: 15px;
+            margin: 20px 0;
+            border-radius: 4px;
+        }
+        .chart {
+            background-color: white;
+            padding: 20px;
+            margin: 20px 0;
+            border-radius: 8px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        .chart h2 {
+            color: #34495e;
+            border-bottom: 2px solid #ecf0f1;
+            padding-bottom: 10px;
+        }
+        .chart img {
+            max-width: 100%;
+            height: auto;
+            display: block;
+            margin: 0 auto;
+        }
+        .footer {
+            text-align: center;
+            margin-top: 40px;
+            padding: 20px;
+            color: #7f8c8d;
+            font-size: 14px;
+        }
+    </style>
+</head>
+<body>
+    <h1>QA Testing Progress Visualizations</h1>
+    
+"""
+
+# Report run details, filled with str.format_map by create_html_report
+HTML_REPORT_INFO = """    <div class="info">
+        <strong>Report Generated:</strong> {generated}<br>
+        <strong>Data Source:</strong> {n_files} CSV files<br>
+        <strong>Time Period:</strong> {t_min} to {t_max}
+    </div>
+"""
+
+HTML_CHART_SECTION = """
+    <div class="chart">
+        <h2>{title}</h2>
+        <img src="{img_name}" alt="{title}">
+    </div>
+"""
+
+HTML_REPORT_FOOTER = b"""
+    <div class="footer">
+        Generated by QA Progress Visualizer<br>
+        For more information, see the documentation
+    </div>
+</body>
+</html>
+"""
+
+# Escapes text placed in the report's HTML (element content and quoted attributes)
+HTML_ESCAPE_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;'})
+
+# Report section titles by chart file name
+CHART_TITLES = {
+    'current_distribution_pie.png': 'Current Test Results Distribution',
+    'trend_line_chart.png': 'Test Results Trend Over Time',
+    'stacked_bar_chart.png': 'Test Results Distribution Over Time (Stacked)',
+    'daily_comparison_bars.png': 'Daily Test Results Comparison',
+    'sheet_details_chart.png': 'Detailed Sheet-by-Sheet Analysis (Raw Counts & Percentages)',
+    'sheet_heatmap.png': 'Pass Rate by Sheet Over Time',
+    'improvement_chart.png': 'Improvement from First to Latest Run'
+}
+
+
+def _seaborn():
+    """
+    Import seaborn on first use and apply the chart style.
+    
+    Seaborn (and the scipy it pulls in) is only needed once a chart is drawn, so
+    importing the module or loading data does not pay for it. Called per process,
+    so chart worker processes get the style too.
+    
+    Returns:
+        The seaborn module
+    """
+    global _sns
+    if _sns is None:
+        import seaborn
+        seaborn.set_style("whitegrid")
+        plt.rcParams['figure.figsize'] = (12, 6)
+        _sns = seaborn
+    return _sns
+
+
+def _count_labels(values) -> List[str]:
+    """Bar labels for test counts, leaving empty segments unlabelled."""
+    return [f'{int(value)}' if value > 0 else '' for value in values]
+
+
+def _render_chart(visualizer, method_name: str):
+    """
+    Render one chart in a worker process.
+    
+    Args:
+        visualizer: Loaded ProgressVisualizer (pickled into the worker)
+        method_name: Name of the create_* method to call
+        
+    Returns:
+        Tuple of (output path or None, error message or None)
+    """
+    try:
+        return getattr(visualizer, method_name)(), None
+    except Exception as e:
+        return None, str(e)
+
 
 class ProgressVisualizer:
     """Creates visualizations for QA testing progress."""
@@ -23,12 +208,42 @@ class ProgressVisualizer:
         self.csv_directory = Path(csv_directory)
         self.csv_files = []
         self.combined_data = None
+        self._results_view = None
+        self._trends = None
+        self._fig = None
+        self._t_min = None
+        self._t_max = None
+        self._sources = {}
         self.output_dir = Path("visualizations")
+        self.dpi = int(os.environ.get('QA_VIZ_DPI', DEFAULT_DPI))
         
-        # Set style
-        sns.set_style("whitegrid")
-        plt.rcParams['figure.figsize'] = (12, 6)
-        
+    def __getstate__(self):
+        """Drop the shared figure when the visualizer is sent to a worker process."""
+        state = self.__dict__.copy()
+        state['_fig'] = None
+        return state
+    
+    def _figure(self, figsize) -> plt.Figure:
+        """
+        Return the shared chart figure, cleared, resized and made current.
+        
+        Args:
+            figsize: (width, height) in inches for the next chart
+            
+        Returns:
+            The reusable matplotlib Figure
+        """
+        # Constrained layout is solved during the savefig draw, so charts need no
+        # separate tight_layout pass
+        if self._fig is None:
+            _seaborn()
+            self._fig = plt.figure(figsize=figsize, layout='constrained')
+        else:
+            self._fig.clear()
+            self._fig.set_size_inches(figsize)
+            plt.figure(self._fig)
+        return self._fig
+    
     def load_csv_files(self, pattern: str = "qa_results_*.csv") -> bool:
         """Load all timestamped CSV files matching the pattern."""
         csv_pattern = str(self.csv_directory / pattern)
@@ -40,36 +255,145 @@ class ProgressVisualizer:
         
         print(f"✓ Found {len(self.csv_files)} CSV files")
         
-        # Load and combine all CSV files
-        dfs = []
-        for csv_file in self.csv_files:
-            df = pd.read_csv(csv_file)
-            dfs.append(df)
-        
-        self.combined_data = pd.concat(dfs, ignore_index=True)
-        
-        # Convert timestamp to datetime
-        self.combined_data['timestamp'] = pd.to_datetime(self.combined_data['timestamp'])
-        
         # Create output directory
         self.output_dir.mkdir(exist_ok=True)
         
-        print(f"✓ Loaded data from {self.combined_data['timestamp'].min()} to {self.combined_data['timestamp'].max()}")
+        # Reuse the snapshot from the last run and only parse CSVs added since then
+        sources = {}
+        for csv_file in self.csv_files:
+            stat = os.stat(csv_file)
+            sources[csv_file] = [stat.st_mtime_ns, stat.st_size]
+        self._sources = sources
+        cached_data, cached_files = self._load_snapshot(sources)
+        new_files = [csv_file for csv_file in self.csv_files if csv_file not in cached_files]
+        
+        if not new_files:
+            self.combined_data = cached_data
+        else:
+            new_data = self._read_csv_files(new_files)
+            if cached_data is None:
+                self.combined_data = new_data
+            else:
+                self.combined_data = pd.concat([cached_data, new_data], ignore_index=True)
+            self._save_snapshot(sources)
+        
+        # Runs in time order, so grouping and first/latest lookups need no further sorting
+        # (a stable sort keeps each run's sheets in file order)
+        self.combined_data = self.combined_data.sort_values('timestamp', kind='mergesort', ignore_index=True)
+        # Sheet names repeat in every run; integer category codes make keying on them cheap
+        self.combined_data['sheet_name'] = self.combined_data['sheet_name'].astype('category')
+        self._compact_columns()
+        self._build_aggregates()
+        
+        # Data is sorted by timestamp, so the first and last rows bound the time period
+        self._t_min = self.combined_data['timestamp'].iloc[0]
+        self._t_max = self.combined_data['timestamp'].iloc[-1]
+        
+        print(f"✓ Loaded data from {self._t_min} to {self._t_max}")
         print(f"✓ Visualizations will be saved to: {self.output_dir}/")
         print()
         return True
     
+    def _compact_columns(self) -> None:
+        """Downcast the count columns and fill in pass rates missing from older CSVs."""
+        data = self.combined_data
+        
+        # Sheet counts, and their per-run sums, never approach 2**31
+        for column in COUNT_COLUMNS:
+            if column in data and data[column].dtype.kind == 'i':
+                data[column] = data[column].astype('int32')
+        
+        # Same rule as qa_analyzer.save_to_csv; kept float64 so labels round as before
+        if 'pass_percentage' not in data:
+            total_tests = data['total_tests']
+            data['pass_percentage'] = (data['pass_count'] / total_tests * 100).round(2).where(total_tests > 0, 0)
+    
+    def _build_aggregates(self) -> None:
+        """Select the rows with results and aggregate them per run, once for all charts."""
+        # Rows of sheets with results, selected once and shared by every chart
+        # (a missing has_results value counts as no results)
+        has_results = self.combined_data['has_results']
+        if has_results.dtype != bool:
+            has_results = has_results.eq(True)
+            self.combined_data['has_results'] = has_results
+        self._results_view = self.combined_data[has_results]
+        
+        # Per-run totals: rows are sorted by timestamp, so factorize numbers the runs in
+        # time order and bincount sums each count column by run code in one pass
+        codes, run_timestamps = pd.factorize(self._results_view['timestamp'])
+        trends = {'timestamp': run_timestamps}
+        for column in ['pass_count', 'fail_count', 'not_available_count', 'total_tests']:
+            weights = self._results_view[column].to_numpy(dtype='float64', na_value=0)
+            trends[column] = np.bincount(codes, weights=weights, minlength=len(run_timestamps)).astype('int64')
+        self._trends = pd.DataFrame(trends)
+        self._trends['pass_percentage'] = (self._trends['pass_count'] / self._trends['total_tests'] * 100).round(2)
+    
+    def _read_csv_files(self, csv_files: List[str]) -> pd.DataFrame:
+        """Parse and combine CSV files, keeping them in the given order."""
+        # Both readers release the GIL while parsing, so threads read the files in
+        # parallel; map keeps them in file order
+        workers = min(len(csv_files), os.cpu_count() or 1)
+        if pa is not None:
+            # Parse in Arrow's C++ reader (timestamps included) and convert to pandas once
+            convert_options = pacsv.ConvertOptions(
+                timestamp_parsers=[TIMESTAMP_FORMAT],
+                column_types={'timestamp': pa.timestamp('ns'), **{column: pa.string() for column in TEXT_COLUMNS}},
+                strings_can_be_null=True
+            )
+            read_table = partial(pacsv.read_csv, convert_options=convert_options)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                combined = pa.concat_tables(executor.map(read_table, csv_files), promote_options='permissive')
+            return combined.to_pandas()
+        
+        # concat consumes the frames as the threads finish them, without a staging list
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            data = pd.concat(executor.map(pd.read_csv, csv_files), ignore_index=True)
+        
+        # Convert timestamp to datetime
+        data['timestamp'] = pd.to_datetime(data['timestamp'])
+        return data
+    
+    def _load_snapshot(self, sources: Dict[str, list]):
+        """
+        Load the combined-data snapshot if every CSV it was built from is unchanged.
+        
+        Returns:
+            (DataFrame, files it covers), or (None, empty set) when there is no usable snapshot
+        """
+        snapshot = self.output_dir / SNAPSHOT_NAME
+        if pa is None or not snapshot.exists():
+            return None, set()
+        
+        try:
+            table = pq.read_table(snapshot)
+            cached_sources = json.loads(table.schema.metadata[SNAPSHOT_SOURCES_KEY])
+        except (OSError, KeyError, TypeError, ValueError, pa.ArrowException):
+            return None, set()
+        
+        # A CSV that was removed or rewritten since the snapshot means starting over
+        if any(sources.get(csv_file) != fingerprint for csv_file, fingerprint in cached_sources.items()):
+            return None, set()
+        
+        return table.to_pandas(), set(cached_sources)
+    
+    def _save_snapshot(self, sources: Dict[str, list]) -> None:
+        """Write the combined data to the snapshot, recording the CSVs it was built from."""
+        if pa is None:
+            return
+        
+        table = pa.Table.from_pandas(self.combined_data, preserve_index=False)
+        metadata = {**(table.schema.metadata or {}), SNAPSHOT_SOURCES_KEY: json.dumps(sources).encode()}
+        pq.write_table(table.replace_schema_metadata(metadata), self.output_dir / SNAPSHOT_NAME,
+                       compression='zstd')
+    
     def create_latest_pie_chart(self) -> str:
         """Create a pie chart for the latest test results."""
         if self.combined_data is None:
             return None
         
         # Get latest data
-        latest_timestamp = self.combined_data['timestamp'].max()
-        latest_data = self.combined_data[
-            (self.combined_data['timestamp'] == latest_timestamp) & 
-            (self.combined_data['has_results'] == True)
-        ]
+        latest_timestamp = self._t_max
+        latest_data = self._results_view[self._results_view['timestamp'] == latest_timestamp]
         
         # Calculate totals
         total_pass = int(latest_data['pass_count'].sum())
@@ -77,7 +401,8 @@ class ProgressVisualizer:
         total_not_available = int(latest_data['not_available_count'].sum())
         
         # Create pie chart
-        fig, ax = plt.subplots(figsize=(10, 8))
+        fig = self._figure((10, 8))
+        ax = fig.subplots()
         
         sizes = [total_pass, total_fail, total_not_available]
         labels = [f'Passed\n{total_pass}', f'Failed\n{total_fail}', f'Not Available\n{total_not_available}']
@@ -107,13 +432,12 @@ class ProgressVisualizer:
         
         # Add total count
         total = total_pass + total_fail + total_not_available
-        plt.figtext(0.5, 0.02, f'Total Tests: {total}', ha='center', fontsize=12, style='italic')
+        fig.supxlabel(f'Total Tests: {total}', fontsize=12, style='italic')
         
         # Save
         output_path = self.output_dir / "current_distribution_pie.png"
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        plt.savefig(output_path, dpi=self.dpi)
+        fig.clear()
         
         print(f"✓ Created pie chart: {output_path}")
         return str(output_path)
@@ -123,20 +447,16 @@ class ProgressVisualizer:
         if self.combined_data is None:
             return None
         
-        # Group by timestamp
-        trends = self.combined_data[self.combined_data['has_results'] == True].groupby('timestamp').agg({
-            'pass_count': 'sum',
-            'fail_count': 'sum',
-            'not_available_count': 'sum',
-            'total_tests': 'sum'
-        }).reset_index()
+        # Totals per run, aggregated at load time
+        trends = self._trends
         
         if len(trends) < 1:
             print("⚠ Not enough data for trend chart")
             return None
         
         # Create figure with two subplots
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10))
+        fig = self._figure((14, 10))
+        ax1, ax2 = fig.subplots(2, 1)
         
         # Plot 1: Raw counts
         ax1.plot(trends['timestamp'], trends['pass_count'], 
@@ -156,20 +476,16 @@ class ProgressVisualizer:
         ax1.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d\n%H:%M'))
         plt.setp(ax1.xaxis.get_majorticklabels(), rotation=45, ha='right')
         
-        # Add value labels on points
-        for idx, row in trends.iterrows():
-            ax1.annotate(f"{int(row['pass_count'])}", 
-                        (row['timestamp'], row['pass_count']),
-                        textcoords="offset points", xytext=(0,10), 
-                        ha='center', fontsize=9, color='#27ae60')
-            ax1.annotate(f"{int(row['fail_count'])}", 
-                        (row['timestamp'], row['fail_count']),
-                        textcoords="offset points", xytext=(0,-15), 
-                        ha='center', fontsize=9, color='#c0392b')
+        # Add value labels on points (plain text nudged by a points offset; no arrows,
+        # so the Annotation machinery isn't needed)
+        above = offset_copy(ax1.transData, fig=fig, x=0, y=10, units='points')
+        below = offset_copy(ax1.transData, fig=fig, x=0, y=-15, units='points')
+        label_kw = {'ha': 'center', 'va': 'baseline', 'fontsize': 9}
+        for ts, p, f in zip(trends['timestamp'], trends['pass_count'].to_numpy(), trends['fail_count'].to_numpy()):
+            ax1.text(ts, p, f"{int(p)}", transform=above, color='#27ae60', **label_kw)
+            ax1.text(ts, f, f"{int(f)}", transform=below, color='#c0392b', **label_kw)
         
         # Plot 2: Pass percentage
-        trends['pass_percentage'] = (trends['pass_count'] / trends['total_tests'] * 100).round(2)
-        
         ax2.plot(trends['timestamp'], trends['pass_percentage'], 
                 marker='o', linewidth=3, markersize=10, label='Pass Rate %', 
                 color='#3498db', markerfacecolor='#2ecc71', markeredgewidth=2, markeredgecolor='#27ae60')
@@ -187,17 +503,15 @@ class ProgressVisualizer:
         plt.setp(ax2.xaxis.get_majorticklabels(), rotation=45, ha='right')
         
         # Add value labels
-        for idx, row in trends.iterrows():
-            ax2.annotate(f"{row['pass_percentage']:.1f}%", 
-                        (row['timestamp'], row['pass_percentage']),
-                        textcoords="offset points", xytext=(0,10), 
-                        ha='center', fontsize=10, weight='bold', color='#2c3e50')
+        above = offset_copy(ax2.transData, fig=fig, x=0, y=10, units='points')
+        for ts, pct in zip(trends['timestamp'], trends['pass_percentage'].to_numpy()):
+            ax2.text(ts, pct, f"{pct:.1f}%", transform=above, ha='center', va='baseline',
+                     fontsize=10, weight='bold', color='#2c3e50')
         
         # Save
         output_path = self.output_dir / "trend_line_chart.png"
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        plt.savefig(output_path, dpi=self.dpi)
+        fig.clear()
         
         print(f"✓ Created trend line chart: {output_path}")
         return str(output_path)
@@ -207,22 +521,19 @@ class ProgressVisualizer:
         if self.combined_data is None:
             return None
         
-        # Group by timestamp
-        trends = self.combined_data[self.combined_data['has_results'] == True].groupby('timestamp').agg({
-            'pass_count': 'sum',
-            'fail_count': 'sum',
-            'not_available_count': 'sum'
-        }).reset_index()
+        # Totals per run, aggregated at load time
+        trends = self._trends
         
         if len(trends) < 1:
             print("⚠ Not enough data for stacked bar chart")
             return None
         
         # Create stacked bar chart
-        fig, ax = plt.subplots(figsize=(14, 8))
+        fig = self._figure((14, 8))
+        ax = fig.subplots()
         
         # Format timestamps for x-axis labels
-        x_labels = [ts.strftime('%Y-%m-%d\n%H:%M') for ts in trends['timestamp']]
+        x_labels = trends['timestamp'].dt.strftime(RUN_LABEL_FORMAT).tolist()
         x_pos = range(len(trends))
         
         # Create stacked bars
@@ -233,24 +544,14 @@ class ProgressVisualizer:
                    bottom=trends['pass_count'] + trends['fail_count'],
                    label='Not Available', color='#95a5a6', edgecolor='white', linewidth=2)
         
-        # Add value labels on bars
-        for i, (p, f, u) in enumerate(zip(trends['pass_count'], trends['fail_count'], trends['not_available_count'])):
-            total = p + f + u
-            # Pass count
-            if p > 0:
-                ax.text(i, p/2, f'{int(p)}', ha='center', va='center', 
-                       fontsize=11, weight='bold', color='white')
-            # Fail count
-            if f > 0:
-                ax.text(i, p + f/2, f'{int(f)}', ha='center', va='center', 
-                       fontsize=11, weight='bold', color='white')
-            # Unknown count
-            if u > 0:
-                ax.text(i, p + f + u/2, f'{int(u)}', ha='center', va='center', 
-                       fontsize=10, weight='bold', color='white')
-            # Total on top
-            ax.text(i, total, f'{int(total)}', ha='center', va='bottom', 
-                   fontsize=12, weight='bold', color='#2c3e50')
+        # Add value labels on bars, with the run total on top
+        segment_style = {'label_type': 'center', 'weight': 'bold', 'color': 'white'}
+        ax.bar_label(p1, labels=_count_labels(trends['pass_count']), fontsize=11, **segment_style)
+        ax.bar_label(p2, labels=_count_labels(trends['fail_count']), fontsize=11, **segment_style)
+        ax.bar_label(p3, labels=_count_labels(trends['not_available_count']), fontsize=10, **segment_style)
+        totals = trends['pass_count'] + trends['fail_count'] + trends['not_available_count']
+        ax.bar_label(p3, labels=[f'{int(total)}' for total in totals],
+                     fontsize=12, weight='bold', color='#2c3e50')
         
         ax.set_xlabel('Date', fontsize=12, weight='bold')
         ax.set_ylabel('Number of Tests', fontsize=12, weight='bold')
@@ -262,9 +563,8 @@ class ProgressVisualizer:
         
         # Save
         output_path = self.output_dir / "stacked_bar_chart.png"
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        plt.savefig(output_path, dpi=self.dpi)
+        fig.clear()
         
         print(f"✓ Created stacked bar chart: {output_path}")
         return str(output_path)
@@ -274,21 +574,18 @@ class ProgressVisualizer:
         if self.combined_data is None:
             return None
         
-        # Group by timestamp
-        trends = self.combined_data[self.combined_data['has_results'] == True].groupby('timestamp').agg({
-            'pass_count': 'sum',
-            'fail_count': 'sum',
-            'not_available_count': 'sum'
-        }).reset_index()
+        # Totals per run, aggregated at load time
+        trends = self._trends
         
         if len(trends) < 1:
             print("⚠ Not enough data for comparison chart")
             return None
         
         # Create grouped bar chart
-        fig, ax = plt.subplots(figsize=(14, 8))
+        fig = self._figure((14, 8))
+        ax = fig.subplots()
         
-        x_labels = [ts.strftime('%Y-%m-%d\n%H:%M') for ts in trends['timestamp']]
+        x_labels = trends['timestamp'].dt.strftime(RUN_LABEL_FORMAT).tolist()
         x = range(len(trends))
         width = 0.25
         
@@ -301,17 +598,8 @@ class ProgressVisualizer:
                        label='Not Available', color='#95a5a6', edgecolor='#7f8c8d', linewidth=1.5)
         
         # Add value labels on bars
-        def add_value_labels(bars):
-            for bar in bars:
-                height = bar.get_height()
-                if height > 0:
-                    ax.text(bar.get_x() + bar.get_width()/2., height,
-                           f'{int(height)}',
-                           ha='center', va='bottom', fontsize=10, weight='bold')
-        
-        add_value_labels(bars1)
-        add_value_labels(bars2)
-        add_value_labels(bars3)
+        for bars, column in [(bars1, 'pass_count'), (bars2, 'fail_count'), (bars3, 'not_available_count')]:
+            ax.bar_label(bars, labels=_count_labels(trends[column]), fontsize=10, weight='bold')
         
         ax.set_xlabel('Date', fontsize=12, weight='bold')
         ax.set_ylabel('Number of Tests', fontsize=12, weight='bold')
@@ -323,9 +611,8 @@ class ProgressVisualizer:
         
         # Save
         output_path = self.output_dir / "daily_comparison_bars.png"
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        plt.savefig(output_path, dpi=self.dpi)
+        fig.clear()
         
         print(f"✓ Created daily comparison chart: {output_path}")
         return str(output_path)
@@ -336,19 +623,19 @@ class ProgressVisualizer:
             return None
         
         # Get data with results
-        data_with_results = self.combined_data[self.combined_data['has_results'] == True].copy()
+        data_with_results = self._results_view
         
         if len(data_with_results) < 1:
             print("⚠ Not enough data for heatmap")
             return None
         
-        # Create pivot table
-        pivot = data_with_results.pivot_table(
-            values='pass_percentage',
-            index='sheet_name',
-            columns='timestamp',
-            aggfunc='first'
-        )
+        # Create pivot table (sheets x runs); unstack avoids pivot_table's aggfunc
+        # dispatch, so keep the first recorded pass rate per sheet and run up front
+        pivot = (data_with_results
+                 .dropna(subset=['pass_percentage'])
+                 .drop_duplicates(['sheet_name', 'timestamp'])
+                 .set_index(['sheet_name', 'timestamp'])['pass_percentage']
+                 .unstack('timestamp'))
         
         if pivot.empty or len(pivot.columns) < 2:
             print("⚠ Not enough data points for heatmap")
@@ -360,14 +647,15 @@ class ProgressVisualizer:
         pivot = pivot.sort_values(by=latest_col, ascending=False)
         
         # Create heatmap
-        fig, ax = plt.subplots(figsize=(max(12, len(pivot.columns) * 2), max(8, len(pivot.index) * 0.5)))
+        fig = self._figure((max(12, len(pivot.columns) * 2), max(8, len(pivot.index) * 0.5)))
+        ax = fig.subplots()
         
-        sns.heatmap(pivot, annot=True, fmt='.1f', cmap='RdYlGn', center=50,
+        _seaborn().heatmap(pivot, annot=True, fmt='.1f', cmap='RdYlGn', center=50,
                    vmin=0, vmax=100, linewidths=1, linecolor='white',
                    cbar_kws={'label': 'Pass Rate (%)'}, ax=ax)
         
         # Format column labels (timestamps)
-        col_labels = [ts.strftime('%Y-%m-%d\n%H:%M') for ts in pivot.columns]
+        col_labels = pivot.columns.strftime(RUN_LABEL_FORMAT).tolist()
         ax.set_xticklabels(col_labels, rotation=45, ha='right')
         
         ax.set_xlabel('Date', fontsize=12, weight='bold')
@@ -376,9 +664,8 @@ class ProgressVisualizer:
         
         # Save
         output_path = self.output_dir / "sheet_heatmap.png"
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        plt.savefig(output_path, dpi=self.dpi)
+        fig.clear()
         
         print(f"✓ Created sheet heatmap: {output_path}")
         return str(output_path)
@@ -389,11 +676,8 @@ class ProgressVisualizer:
             return None
         
         # Get latest data
-        latest_timestamp = self.combined_data['timestamp'].max()
-        latest_data = self.combined_data[
-            (self.combined_data['timestamp'] == latest_timestamp) & 
-            (self.combined_data['has_results'] == True)
-        ].copy()
+        latest_timestamp = self._t_max
+        latest_data = self._results_view[self._results_view['timestamp'] == latest_timestamp]
         
         if len(latest_data) < 1:
             print("⚠ No data for sheet details chart")
@@ -403,7 +687,8 @@ class ProgressVisualizer:
         latest_data = latest_data.sort_values('pass_percentage', ascending=True)
         
         # Create figure with two subplots side by side
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(20, max(10, len(latest_data) * 0.4)))
+        fig = self._figure((20, max(10, len(latest_data) * 0.4)))
+        ax1, ax2 = fig.subplots(1, 2)
         
         sheet_names = latest_data['sheet_name'].tolist()
         y_pos = range(len(sheet_names))
@@ -420,24 +705,14 @@ class ProgressVisualizer:
         left_unknown = [p + f for p, f in zip(pass_counts, fail_counts)]
         p3 = ax1.barh(y_pos, not_available_counts, left=left_unknown, label='Not Available', color='#95a5a6', edgecolor='white', linewidth=1)
         
-        # Add value labels on bars
-        for i, (p, f, u) in enumerate(zip(pass_counts, fail_counts, not_available_counts)):
-            total = p + f + u
-            # Pass count
-            if p > 0:
-                ax1.text(p/2, i, f'{int(p)}', ha='center', va='center', 
-                        fontsize=9, weight='bold', color='white')
-            # Fail count
-            if f > 0:
-                ax1.text(p + f/2, i, f'{int(f)}', ha='center', va='center', 
-                        fontsize=9, weight='bold', color='white')
-            # Unknown count
-            if u > 0:
-                ax1.text(p + f + u/2, i, f'{int(u)}', ha='center', va='center', 
-                        fontsize=8, weight='bold', color='white')
-            # Total at the end
-            ax1.text(total + 2, i, f'Total: {int(total)}', ha='left', va='center', 
-                    fontsize=9, weight='bold', color='#2c3e50')
+        # Add value labels on bars, with the sheet total at the end
+        segment_style = {'label_type': 'center', 'weight': 'bold', 'color': 'white'}
+        ax1.bar_label(p1, labels=_count_labels(pass_counts), fontsize=9, **segment_style)
+        ax1.bar_label(p2, labels=_count_labels(fail_counts), fontsize=9, **segment_style)
+        ax1.bar_label(p3, labels=_count_labels(not_available_counts), fontsize=8, **segment_style)
+        totals = [left + u for left, u in zip(left_unknown, not_available_counts)]
+        ax1.bar_label(p3, labels=[f'Total: {int(total)}' for total in totals], padding=5,
+                      fontsize=9, weight='bold', color='#2c3e50')
         
         ax1.set_yticks(y_pos)
         ax1.set_yticklabels(sheet_names, fontsize=10)
@@ -462,8 +737,7 @@ class ProgressVisualizer:
         bars = ax2.barh(y_pos, pass_percentages, color=bar_colors, edgecolor='#2c3e50', linewidth=1)
         
         # Add percentage labels
-        for i, (bar, pct, p, f, u) in enumerate(zip(bars, pass_percentages, pass_counts, fail_counts, not_available_counts)):
-            total = p + f + u
+        for bar, pct, p, f, u in zip(bars, pass_percentages, pass_counts, fail_counts, not_available_counts):
             # Percentage on the bar
             ax2.text(pct/2, bar.get_y() + bar.get_height()/2, 
                     f'{pct:.1f}%', ha='center', va='center', 
@@ -495,13 +769,12 @@ class ProgressVisualizer:
         
         # Overall title
         fig.suptitle(f'Detailed Sheet-by-Sheet Analysis\n{latest_timestamp.strftime("%Y-%m-%d %H:%M")}', 
-                    fontsize=16, weight='bold', y=0.98)
+                    fontsize=16, weight='bold')
         
         # Save
         output_path = self.output_dir / "sheet_details_chart.png"
-        plt.tight_layout(rect=[0, 0, 1, 0.96])
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        plt.savefig(output_path, dpi=self.dpi)
+        fig.clear()
         
         print(f"✓ Created sheet details chart: {output_path}")
         return str(output_path)
@@ -511,8 +784,8 @@ class ProgressVisualizer:
         if self.combined_data is None:
             return None
         
-        # Get first and last timestamps
-        timestamps = sorted(self.combined_data['timestamp'].unique())
+        # Get first and last timestamps (the data is sorted by timestamp at load time)
+        timestamps = self.combined_data['timestamp'].unique()
         
         if len(timestamps) < 2:
             print("⚠ Need at least 2 runs to show improvement")
@@ -521,30 +794,23 @@ class ProgressVisualizer:
         first_ts = timestamps[0]
         last_ts = timestamps[-1]
         
-        # Get data for both timestamps
-        first_data = self.combined_data[
-            (self.combined_data['timestamp'] == first_ts) & 
-            (self.combined_data['has_results'] == True)
-        ]
-        last_data = self.combined_data[
-            (self.combined_data['timestamp'] == last_ts) & 
-            (self.combined_data['has_results'] == True)
-        ]
-        
-        # Calculate totals
+        # Totals for both runs from the per-run aggregate (a run without results counts as 0)
+        run_totals = self._trends.set_index('timestamp').reindex([first_ts, last_ts], fill_value=0)
+        first_row, last_row = run_totals.iloc[0], run_totals.iloc[1]
         first_totals = {
-            'pass': int(first_data['pass_count'].sum()),
-            'fail': int(first_data['fail_count'].sum()),
-            'not_available': int(first_data['not_available_count'].sum())
+            'pass': int(first_row['pass_count']),
+            'fail': int(first_row['fail_count']),
+            'not_available': int(first_row['not_available_count'])
         }
         last_totals = {
-            'pass': int(last_data['pass_count'].sum()),
-            'fail': int(last_data['fail_count'].sum()),
-            'not_available': int(last_data['not_available_count'].sum())
+            'pass': int(last_row['pass_count']),
+            'fail': int(last_row['fail_count']),
+            'not_available': int(last_row['not_available_count'])
         }
         
         # Create comparison chart
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 7))
+        fig = self._figure((16, 7))
+        ax1, ax2 = fig.subplots(1, 2)
         
         categories = ['Passed', 'Failed', 'Not Available']
         first_values = [first_totals['pass'], first_totals['fail'], first_totals['not_available']]
@@ -609,9 +875,8 @@ class ProgressVisualizer:
         
         # Save
         output_path = self.output_dir / "improvement_chart.png"
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        plt.savefig(output_path, dpi=self.dpi)
+        fig.clear()
         
         print(f"✓ Created improvement chart: {output_path}")
         return str(output_path)
@@ -627,22 +892,34 @@ class ProgressVisualizer:
         
         # Create each visualization
         charts = [
-            ("Current distribution pie chart", self.create_latest_pie_chart),
-            ("Trend line chart", self.create_trend_line_chart),
-            ("Stacked bar chart", self.create_stacked_bar_chart),
-            ("Daily comparison bars", self.create_daily_comparison_bars),
-            ("Sheet details chart", self.create_sheet_details_chart),
-            ("Sheet heatmap", self.create_sheet_heatmap),
-            ("Improvement chart", self.create_improvement_chart)
+            ("Current distribution pie chart", 'create_latest_pie_chart'),
+            ("Trend line chart", 'create_trend_line_chart'),
+            ("Stacked bar chart", 'create_stacked_bar_chart'),
+            ("Daily comparison bars", 'create_daily_comparison_bars'),
+            ("Sheet details chart", 'create_sheet_details_chart'),
+            ("Sheet heatmap", 'create_sheet_heatmap'),
+            ("Improvement chart", 'create_improvement_chart')
         ]
         
-        for name, func in charts:
+        # Charts are independent and spend their time in the Agg renderer,
+        # so render them on separate cores
+        method_names = [method for _, method in charts]
+        max_workers = min(len(charts), os.cpu_count() or 1)
+        results = None
+        if max_workers > 1:
             try:
-                result = func()
-                if result:
-                    output_files.append(result)
-            except Exception as e:
-                print(f"⚠ Error creating {name}: {e}")
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    results = list(executor.map(_render_chart, [self] * len(charts), method_names))
+            except (OSError, BrokenProcessPool):
+                results = None
+        if results is None:
+            results = [_render_chart(self, method) for method in method_names]
+        
+        for (name, _), (result, error) in zip(charts, results):
+            if error:
+                print(f"⚠ Error creating {name}: {error}")
+            elif result:
+                output_files.append(result)
         
         print()
         print("=" * 70)
@@ -654,105 +931,58 @@ class ProgressVisualizer:
         
         return output_files
     
-    def create_html_report(self, image_files: List[str]) -> str:
-        """Create an HTML report with all visualizations."""
-        html_content = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>QA Testing Progress Visualizations</title>
-    <style>
-        body {{
-            font-family: Arial, sans-serif;
-            max-width: 1400px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        h1 {{
-            color: #2c3e50;
-            text-align: center;
-            border-bottom: 3px solid #3498db;
-            padding-bottom: 10px;
-        }}
-        .info {{
-            background-color: #e8f4f8;
-            border-left: 4px solid #3498db;
-            padding: 15px;
-            margin: 20px 0;
-            border-radius: 4px;
-        }}
-        .chart {{
-            background-color: white;
-            padding: 20px;
-            margin: 20px 0;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .chart h2 {{
-            color: #34495e;
-            border-bottom: 2px solid #ecf0f1;
-            padding-bottom: 10px;
-        }}
-        .chart img {{
-            max-width: 100%;
-            height: auto;
-            display: block;
-            margin: 0 auto;
-        }}
-        .footer {{
-            text-align: center;
-            margin-top: 40px;
-            padding: 20px;
-            color: #7f8c8d;
-            font-size: 14px;
-        }}
-    </style>
-</head>
-<body>
-    <h1>QA Testing Progress Visualizations</h1>
-    
-    <div class="info">
-        <strong>Report Generated:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}<br>
-        <strong>Data Source:</strong> {len(self.csv_files)} CSV files<br>
-        <strong>Time Period:</strong> {self.combined_data['timestamp'].min()} to {self.combined_data['timestamp'].max()}
-    </div>
-"""
-        
-        # Add each chart
-        chart_titles = {
-            'current_distribution_pie.png': 'Current Test Results Distribution',
-            'trend_line_chart.png': 'Test Results Trend Over Time',
-            'stacked_bar_chart.png': 'Test Results Distribution Over Time (Stacked)',
-            'daily_comparison_bars.png': 'Daily Test Results Comparison',
-            'sheet_details_chart.png': 'Detailed Sheet-by-Sheet Analysis (Raw Counts & Percentages)',
-            'sheet_heatmap.png': 'Pass Rate by Sheet Over Time',
-            'improvement_chart.png': 'Improvement from First to Latest Run'
+    def _render_key(self) -> str:
+        """Hash of everything the rendered output depends on: the CSVs, the dpi and this script."""
+        script = os.stat(__file__)
+        inputs = {
+            'sources': self._sources,
+            'dpi': self.dpi,
+            'code': [script.st_mtime_ns, script.st_size]
         }
+        return hashlib.blake2b(json.dumps(inputs, sort_keys=True).encode('utf-8')).hexdigest()
+    
+    def outputs_up_to_date(self) -> bool:
+        """Check whether the charts and report were already rendered from the loaded CSVs."""
+        try:
+            with open(self.output_dir / RENDER_KEY_NAME, 'r', encoding='utf-8') as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return False
         
-        for img_file in image_files:
-            img_name = Path(img_file).name
-            title = chart_titles.get(img_name, img_name)
-            html_content += f"""
-    <div class="chart">
-        <h2>{title}</h2>
-        <img src="{img_name}" alt="{title}">
-    </div>
-"""
-        
-        html_content += """
-    <div class="footer">
-        Generated by QA Progress Visualizer<br>
-        For more information, see the documentation
-    </div>
-</body>
-</html>
-"""
+        if record.get('key') != self._render_key():
+            return False
+        return all(os.path.exists(path) for path in record.get('files', []))
+    
+    def save_render_key(self, output_files: List[str]) -> None:
+        """Record the inputs the current charts and report were rendered from."""
+        record = {'key': self._render_key(), 'files': output_files}
+        with open(self.output_dir / RENDER_KEY_NAME, 'w', encoding='utf-8') as f:
+            json.dump(record, f)
+    
+    def create_html_report(self, image_files: List[str]) -> str:
+        """Create an HTML report with all visualizations."""
+        info = HTML_REPORT_INFO.format_map({
+            'generated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'n_files': len(self.csv_files),
+            't_min': self._t_min,
+            't_max': self._t_max
+        })
+        
+        # One section per chart, with names and titles resolved up front
+        img_names = list(map(os.path.basename, image_files))
+        titles = [CHART_TITLES.get(img_name, img_name) for img_name in img_names]
+        sections = ''.join(
+            HTML_CHART_SECTION.format_map({
+                'title': title.translate(HTML_ESCAPE_TABLE),
+                'img_name': img_name.translate(HTML_ESCAPE_TABLE)
+            })
+            for img_name, title in zip(img_names, titles)
+        )
         
+        # Only the run details and chart sections need encoding; the static head and
+        # footer are already bytes. Write the whole report in one call.
         output_path = self.output_dir / "visualizations_report.html"
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        output_path.write_bytes(b''.join([HTML_REPORT_HEAD, (info + sections).encode('utf-8'), HTML_REPORT_FOOTER]))
         
         print(f"✓ Created HTML report: {output_path}")
         print(f"  Open this file in your web browser to view all charts")
@@ -775,21 +1005,37 @@ def main():
         print("No CSV files to visualize. Run qa_analyzer.py first to generate data.")
         return
     
+    # Nothing to redraw if no CSV (or this script) changed since the last run
+    if visualizer.outputs_up_to_date():
+        sys.stdout.write("\n".join([
+            "✓ Visualizations are up to date (no CSV changes since the last run)",
+            f"  Open: {visualizer.output_dir}/visualizations_report.html",
+            f"  Delete {visualizer.output_dir}/{RENDER_KEY_NAME} to force a full redraw",
+        ]) + "\n")
+        sys.stdout.flush()
+        return
+    
     # Create all visualizations
     image_files = visualizer.create_all_visualizations()
     
     # Create HTML report
     if image_files:
-        visualizer.create_html_report(image_files)
-        
-        print("\n" + "=" * 70)
-        print("🎨 VISUALIZATION COMPLETE!")
-        print("=" * 70)
-        print()
-        print(f"View your charts:")
-        print(f"  1. Open: {visualizer.output_dir}/visualizations_report.html")
-        print(f"  2. Or check individual PNG files in: {visualizer.output_dir}/")
-        print()
+        report_file = visualizer.create_html_report(image_files)
+        visualizer.save_render_key(image_files + [report_file])
+        
+        # One write for the whole completion banner
+        sys.stdout.write("\n".join([
+            "",
+            "=" * 70,
+            "🎨 VISUALIZATION COMPLETE!",
+            "=" * 70,
+            "",
+            "View your charts:",
+            f"  1. Open: {visualizer.output_dir}/visualizations_report.html",
+            f"  2. Or check individual PNG files in: {visualizer.output_dir}/",
+            "",
+        ]) + "\n")
+        sys.stdout.flush()
 
 
 if __name__ == "__main__":